@@ -33,6 +33,7 @@ from .helpers.api import AsyncConfigEntryAuth
 from .helpers.config_data import HLConfigEntry, HLData
 from .helpers.coordinator import HomeLINKDataCoordinator
 from .helpers.mqtt import HAMQTT, HomeLINKMQTT
+from .helpers.snapshot import HomeLINKSnapshot
 from .helpers.webhook import HomeLINKWebhook
 
 _LOGGER = logging.getLogger(__name__)
@@ -67,23 +68,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: HLConfigEntry) -> bool:
         AsyncConfigEntryAuth(aiohttp_client.async_get_clientsession(hass), session)
     )
 
-    # Initiate co-ordinator
+    # Initiate co-ordinator, from the last snapshot if there is one
     hl_coordinator = HomeLINKDataCoordinator(hass, hl_api, entry)
-    await hl_coordinator.async_config_entry_first_refresh()
+    warm_start = await hl_coordinator.async_warm_start()
+    if not warm_start:
+        await hl_coordinator.async_config_entry_first_refresh()
     entry.runtime_data = HLData(hl_coordinator, entry.options, None, None)
 
     # Setup MQTT if required
     if entry.options.get(CONF_MQTT_ENABLE):
         hl_mqtt = await _async_start_mqtt(hass, entry)
         entry.runtime_data.mqtt = hl_mqtt
+        hl_coordinator.async_add_push_channel(hl_mqtt)
 
     #  Setup webhooks if required
     if entry.options.get(CONF_WEBHOOK_ENABLE):
         hl_webhook = HomeLINKWebhook(entry)
         hl_webhook.register_webhooks(hass, entry.options.get(CONF_WEBHOOK_ID))
         entry.runtime_data.webhook = hl_webhook
+        hl_coordinator.async_add_push_channel(hl_webhook)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Alarmed devices are named from the device registry, which is only
+    # populated once the platforms are set up
+    hl_coordinator.async_update_listeners()
+
+    # After a warm start, bring the snapshot up to date in the background
+    if warm_start:
+        entry.async_create_background_task(
+            hass, hl_coordinator.async_refresh_live(), "homelink_refresh_live"
+        )
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -106,6 +120,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: HLConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: HLConfigEntry) -> None:
+    """Remove the stored snapshot when the entry is removed."""
+    await HomeLINKSnapshot(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: HLConfigEntry) -> None:
     """Handle options update - only reload if the options have changed."""
     if entry.runtime_data.options != entry.options:
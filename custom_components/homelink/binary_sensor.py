@@ -9,14 +9,10 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
-from pyhomelink.alert import Alert
-from pyhomelink.device import Device
 
 from .const import (
     ALARMS_NONE,
@@ -25,42 +21,33 @@ from .const import (
     ATTR_ADDRESS,
     ATTR_ALARMED_DEVICES,
     ATTR_ALARMED_ROOMS,
-    ATTR_ALERTID,
     ATTR_ALERTS,
-    ATTR_CATEGORY,
     ATTR_CONNECTIVITYTYPE,
     ATTR_DATACOLLECTIONSTATUS,
-    ATTR_DESCRIPTION,
-    ATTR_DEVICE,
-    ATTR_EVENTTYPE,
     ATTR_INSTALLATIONDATE,
     ATTR_INSTALLEDBY,
     ATTR_LASTSEENDATE,
     ATTR_LASTTESTDATE,
     ATTR_METADATA,
     ATTR_OPERATIONALSTATUS,
-    ATTR_RAISEDDATE,
     ATTR_REFERENCE,
     ATTR_REPLACEDATE,
     ATTR_SERIALNUMBER,
-    ATTR_SEVERITY,
     ATTR_SIGNALSTRENGTH,
     ATTR_STATUS,
     ATTR_TAGS,
-    ATTR_TYPE,
     ATTRIBUTION,
-    CATEGORY_INSIGHT,
     CONF_MQTT_ENABLE,
     CONF_MQTT_TOPIC,
     CONF_WEBHOOK_ENABLE,
     COORD_ALERTS,
+    COORD_ALERTS_VIEW,
     COORD_DEVICES,
     COORD_GATEWAY_KEY,
     COORD_PROPERTIES,
     COORD_PROPERTY,
     DOMAIN,
-    HOMELINK_ADD_DEVICE,
-    HOMELINK_ADD_PROPERTY,
+    HOMELINK_ADD_TOPOLOGY,
     HOMELINK_MESSAGE_MQTT,
     MODELLIST_ALARMS,
     MODELLIST_ENERGY,
@@ -73,19 +60,20 @@ from .const import (
     HomeLINKMessageType,
 )
 from .helpers.config_data import HLConfigEntry
-from .helpers.coordinator import HomeLINKDataCoordinator
+from .helpers.coordinator import AddedDevice, HomeLINKDataCoordinator
 from .helpers.entity import (
     HomeLINKAlarmEntity,
+    HomeLINKCoordinatorEntity,
     HomeLINKDeviceEntity,
 )
 from .helpers.utils import (
-    build_device_identifiers,
     build_mqtt_device_key,
     get_message_date,
     property_device_info,
     raise_device_event,
     raise_property_alarm_event,
 )
+from .helpers.views import AlertEntry
 
 PARALLEL_UPDATES = 1
 
@@ -102,62 +90,64 @@ async def async_setup_entry(
     # - Property (Environment) Alarm - if there are eny environment devices
     # - Each device (apart from energy devices since they have no alert status)
 
-    @callback
-    def async_add_property(hl_property):
-        # Callback since this can be initiated post setup by coordinator
-        async_add_entities([HomeLINKProperty(hass, entry, hl_coordinator, hl_property)])
-        async_add_entities(
-            [HomeLINKAlarm(hass, entry, hl_coordinator, hl_property, ALARMTYPE_ALARM)]
-        )
+    def _property_entities(hl_property: str) -> list[BinarySensorEntity]:
+        entities: list[BinarySensorEntity] = [
+            HomeLINKProperty(hass, entry, hl_coordinator, hl_property),
+            HomeLINKAlarm(hass, entry, hl_coordinator, hl_property, ALARMTYPE_ALARM),
+        ]
         environment = False
         for device_key, device in hl_coordinator.data[COORD_PROPERTIES][hl_property][
             COORD_DEVICES
         ].items():
             if device.modeltype not in MODELLIST_ENERGY:
-                async_add_device(hl_property, device_key, None, None)
+                entities.extend(_device_entities(hl_property, device_key))
             if device.modeltype in MODELLIST_ENVIRONMENT:
                 environment = True
 
         if environment:
-            async_add_entities(
-                [
-                    HomeLINKAlarm(
-                        hass, entry, hl_coordinator, hl_property, ALARMTYPE_ENVIRONMENT
-                    )
-                ]
+            entities.append(
+                HomeLINKAlarm(
+                    hass, entry, hl_coordinator, hl_property, ALARMTYPE_ENVIRONMENT
+                )
             )
+        return entities
+
+    def _device_entities(hl_property: str, device_key: str) -> list[BinarySensorEntity]:
+        return [HomeLINKDevice(entry, hl_coordinator, hl_property, device_key)]
 
     @callback
-    def async_add_device(
-        hl_property: str,
-        device_key: str,
-        device: Device,  # pylint: disable=unused-argument
-        gateway_key: str,  # pylint: disable=unused-argument
+    def async_add_topology(
+        hl_properties: list[str], added_devices: list[AddedDevice]
     ) -> None:
         # Callback since this can be initiated post setup by coordinator
-        async_add_entities(
-            [HomeLINKDevice(entry, hl_coordinator, hl_property, device_key)]
-        )
-
-    for hl_property in hl_coordinator.data[COORD_PROPERTIES]:
-        async_add_property(hl_property)
-
-    entry.async_on_unload(
-        async_dispatcher_connect(hass, HOMELINK_ADD_PROPERTY, async_add_property)
+        entities = [
+            entity
+            for hl_property in hl_properties
+            for entity in _property_entities(hl_property)
+        ]
+        for added in added_devices:
+            entities.extend(_device_entities(added.hl_property_key, added.device_key))
+        async_add_entities(entities)
+
+    # The entities for every property are added as a single batch
+    async_add_entities(
+        [
+            entity
+            for hl_property in hl_coordinator.data[COORD_PROPERTIES]
+            for entity in _property_entities(hl_property)
+        ]
     )
+
     entry.async_on_unload(
-        async_dispatcher_connect(
-            hass,
-            HOMELINK_ADD_DEVICE,
-            async_add_device,
-        )
+        async_dispatcher_connect(hass, HOMELINK_ADD_TOPOLOGY, async_add_topology)
     )
 
 
-class HomeLINKProperty(CoordinatorEntity[HomeLINKDataCoordinator], BinarySensorEntity):
+class HomeLINKProperty(HomeLINKCoordinatorEntity, BinarySensorEntity):
     """Property entity object for HomeLINK sensor."""
 
     _attr_has_entity_name = True
+    _coordinator_tiers = (COORD_ALERTS,)
     _attr_attribution = ATTRIBUTION
     _unrecorded_attributes = frozenset(
         (ATTR_REFERENCE, ATTR_ADDRESS, ATTR_LATITUDE, ATTR_LONGITUDE)
@@ -171,10 +161,9 @@ class HomeLINKProperty(CoordinatorEntity[HomeLINKDataCoordinator], BinarySensorE
         hl_property_key: str,
     ) -> None:
         """Property entity object for HomeLINK sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(hl_property_key, None))
         self._status: bool | None = None
         self._alarms: list[str | None] | str = []
-        self._dev_reg = device_registry.async_get(hass)
         self._key = hl_property_key
         self._property = self.coordinator.data[COORD_PROPERTIES][self._key]
         self._gateway_key = self._property[COORD_GATEWAY_KEY]
@@ -226,7 +215,7 @@ class HomeLINKProperty(CoordinatorEntity[HomeLINKDataCoordinator], BinarySensorE
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
         self._update_attributes()
-        self.async_write_ha_state()
+        self._async_write_changed_state()
 
     def _update_attributes(self) -> None:
         if self._key in self.coordinator.data[COORD_PROPERTIES]:
@@ -238,15 +227,10 @@ class HomeLINKProperty(CoordinatorEntity[HomeLINKDataCoordinator], BinarySensorE
         status = STATUS_GOOD
         alarms = []
         # Identify if there are any alerts for the property and set status accordingly
-        for alert in self.coordinator.data[COORD_PROPERTIES][self._key][COORD_ALERTS]:
-            if alert.rel.hl_property == f"property/{self._key}" and hasattr(
-                alert.rel, ATTR_DEVICE
-            ):
-                status = STATUS_NOT_GOOD
-                if devicereg := self._dev_reg.async_get_device(
-                    build_device_identifiers(alert.serialnumber)
-                ):
-                    alarms.append(devicereg.name_by_user or devicereg.name)
+        for entry in self._property[COORD_ALERTS_VIEW].property_alerts:
+            status = STATUS_NOT_GOOD
+            if name := self.coordinator.device_names.get(entry.alert.serialnumber):
+                alarms.append(name)
 
         return status != STATUS_GOOD, alarms or ALARMS_NONE
 
@@ -255,6 +239,7 @@ class HomeLINKAlarm(HomeLINKAlarmEntity, BinarySensorEntity):
     """Property entity object for HomeLINK sensor."""
 
     _attr_has_entity_name = True
+    _coordinator_tiers = (COORD_ALERTS,)
     _attr_attribution = ATTRIBUTION
     _unrecorded_attributes = frozenset(
         (ATTR_REFERENCE, ATTR_ADDRESS, ATTR_LATITUDE, ATTR_LONGITUDE)
@@ -273,7 +258,6 @@ class HomeLINKAlarm(HomeLINKAlarmEntity, BinarySensorEntity):
         self._status: bool | None = None
         self._alarms_devices: list[str | None] | str = []
         self._alarms_rooms: list[str | None] | str = []
-        self._dev_reg = device_registry.async_get(hass)
         super().__init__(coordinator, hl_property_key, alarm_type)
         self._entry = entry
         self._attr_unique_id = f"{self._key}_{alarm_type}"
@@ -350,17 +334,16 @@ class HomeLINKAlarm(HomeLINKAlarmEntity, BinarySensorEntity):
         # If there is no serial number of location on the alert then it is not for a device
         # If it is for an environment sensor, then there will be no serial number, so allocate
         # to a 'virtual' room.
-        for alert in self._get_alerts():
+        for entry in self._get_alerts():
+            alert = entry.alert
             status = STATUS_NOT_GOOD
             if not alert.serialnumber and not alert.location:
                 continue
             if alert.serialnumber:
-                if devicereg := self._dev_reg.async_get_device(
-                    build_device_identifiers(alert.serialnumber)
-                ):
-                    device = devicereg.name_by_user or devicereg.name
-                    if device not in alarms_devices:
-                        alarms_devices.append(device)
+                if (
+                    device := self.coordinator.device_names.get(alert.serialnumber)
+                ) and device not in alarms_devices:
+                    alarms_devices.append(device)
             else:
                 location = alert.locationnickname or alert.location
                 if location not in alarms_rooms:
@@ -376,52 +359,23 @@ class HomeLINKAlarm(HomeLINKAlarmEntity, BinarySensorEntity):
         # Alerts relate to devices on than environment sensor
         # so there is no location
         return [
-            {
-                ATTR_ALERTID: alert.alertid,
-                ATTR_STATUS: alert.status,
-                ATTR_EVENTTYPE: alert.eventtype,
-                ATTR_SEVERITY: alert.severity,
-                ATTR_RAISEDDATE: alert.raiseddate,
-                ATTR_CATEGORY: alert.category,
-                ATTR_TYPE: alert.hl_type,
-                ATTR_DESCRIPTION: alert.description,
-            }
-            for alert in self._get_alerts()
-            if not alert.location
+            entry.attributes for entry in self._get_alerts() if not entry.alert.location
         ]
 
-    def _get_alerts(self) -> list[Alert]:
+    def _get_alerts(self) -> list[AlertEntry]:
         # Retrieve the alert if:
         # - Device is environment and the alert is and insight
         # - Device is alarm and alert is not environment and not an insight
         # - Device is environment and alert is environment and not an insight
-        return [
-            alert
-            for alert in self.coordinator.data[COORD_PROPERTIES][self._key][
-                COORD_ALERTS
-            ]
-            if (
-                alert.category == CATEGORY_INSIGHT
-                and self._alarm_type == ALARMTYPE_ENVIRONMENT
-            )
-            or (
-                alert.category != CATEGORY_INSIGHT
-                and alert.modeltype not in MODELLIST_ENVIRONMENT
-                and self._alarm_type == ALARMTYPE_ALARM
-            )
-            or (
-                alert.category != CATEGORY_INSIGHT
-                and alert.modeltype in MODELLIST_ENVIRONMENT
-                and self._alarm_type == ALARMTYPE_ENVIRONMENT
-            )
-        ]
+        return self._property[COORD_ALERTS_VIEW].alarm_types[self._alarm_type]
 
     @callback
     async def _async_message_handle(
         self, topic: str, payload: dict, messagetype: str
     ) -> None:
         # Process message if it is new (so as to ignore messages retained on the MQTT broker)
-        # Initiates a co-ordinator refresh for Device/Property/Alert
+        # Initiates a topology refresh for Property, and a refresh of just this
+        # property's devices for Device or alerts for Alert
         msgdate = get_message_date(payload)
         if msgdate < self._lastdate:
             return
@@ -429,19 +383,21 @@ class HomeLINKAlarm(HomeLINKAlarmEntity, BinarySensorEntity):
 
         raise_property_alarm_event(self.hass, messagetype, topic, payload)
 
-        if messagetype in [
-            HomeLINKMessageType.MESSAGE_DEVICE,
-            HomeLINKMessageType.MESSAGE_PROPERTY,
-            HomeLINKMessageType.MESSAGE_ALERT,
-        ]:
-            await self.coordinator.async_refresh()
+        if messagetype == HomeLINKMessageType.MESSAGE_PROPERTY:
+            await self.coordinator.async_refresh_topology()
             return
+        if messagetype == HomeLINKMessageType.MESSAGE_DEVICE:
+            await self.coordinator.async_refresh_property_devices(self._key)
+            return
+        if messagetype == HomeLINKMessageType.MESSAGE_ALERT:
+            await self.coordinator.async_refresh_property_alerts(self._key)
 
 
 class HomeLINKDevice(HomeLINKDeviceEntity, BinarySensorEntity):
     """Device entity object for HomeLINK sensor."""
 
     _attr_has_entity_name = True
+    _coordinator_tiers = (COORD_ALERTS,)
     _attr_attribution = ATTRIBUTION
     _unrecorded_attributes = frozenset(
         (
@@ -557,7 +513,7 @@ class HomeLINKDevice(HomeLINKDeviceEntity, BinarySensorEntity):
             COORD_GATEWAY_KEY
         ]
         self._alerts = self._set_alerts()
-        self._status = self._set_status()
+        self._status = bool(self._alerts)
 
     def _is_data_in_coordinator(self) -> bool:
         return (
@@ -566,45 +522,21 @@ class HomeLINKDevice(HomeLINKDeviceEntity, BinarySensorEntity):
             in self.coordinator.data[COORD_PROPERTIES][self._parent_key][COORD_DEVICES]
         )
 
-    def _set_status(self) -> bool:
-        return bool(self._get_alerts())
-
     def _set_alerts(self) -> list[dict]:
-        alerts = self._get_alerts()
-        return [
-            {
-                ATTR_ALERTID: alert.alertid,
-                ATTR_STATUS: alert.status,
-                ATTR_EVENTTYPE: alert.eventtype,
-                ATTR_SEVERITY: alert.severity,
-                ATTR_RAISEDDATE: alert.raiseddate,
-                ATTR_CATEGORY: alert.category,
-                ATTR_TYPE: alert.hl_type,
-                ATTR_DESCRIPTION: alert.description,
-            }
-            for alert in alerts
-        ]
-
-    def _get_alerts(self) -> list[Alert]:
         # Retrieve the alert if:
         # - The alert is a device and is for the entity device
         # - The alert location is entity location and there is no serialnumber
         #   (which indicates it is an environment alert)
+        alerts_view = self.coordinator.data[COORD_PROPERTIES][self._parent_key][
+            COORD_ALERTS_VIEW
+        ]
         return [
-            alert
-            for alert in self.coordinator.data[COORD_PROPERTIES][self._parent_key][
-                COORD_ALERTS
-            ]
-            if (
-                (
-                    hasattr(alert.rel, ATTR_DEVICE)
-                    and self._device.rel.self == alert.rel.device
-                )
-                or (
-                    alert.location == self._device.location
-                    and self._device.modeltype in MODELLIST_ENVIRONMENT
-                    and not alert.serialnumber
-                )
+            entry.attributes
+            for entry in alerts_view.device_alerts(
+                self._device.rel.self,
+                self._device.location
+                if self._device.modeltype in MODELLIST_ENVIRONMENT
+                else None,
             )
         ]
 
@@ -614,7 +546,7 @@ class HomeLINKDevice(HomeLINKDeviceEntity, BinarySensorEntity):
     ) -> None:
         # Process message if it is new (so as to ignore messages retained on the MQTT broker)
         # If it is a reading then pass it over to the reading sensor by dispatch
-        # Otherwise initiates a co-ordinator refresh for Alert
+        # Otherwise initiates an alerts refresh for Alert
         msgdate = get_message_date(payload)
         if (
             msgdate < self._lastdate
@@ -629,7 +561,7 @@ class HomeLINKDevice(HomeLINKDeviceEntity, BinarySensorEntity):
 
         raise_device_event(self.hass, self.device_info, messagetype, topic, payload)
         if messagetype == HomeLINKMessageType.MESSAGE_ALERT:
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_refresh_property_alerts(self._parent_key)
 
     def _process_reading(self, payload: dict, topic: str, messagetype: str) -> None:
         # Dispatch to reading sensor
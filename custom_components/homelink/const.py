@@ -80,24 +80,29 @@ CONF_WEBHOOK_ENABLE = "webhook_enable"
 
 
 COORD_ALERTS = "alerts"
+COORD_ALERTS_VIEW = "alerts_view"
 COORD_CONFIG_ENTRY_OPTIONS = "config_entry_options"
 COORD_DEVICES = "devices"
 COORD_GATEWAY_KEY = "gateway_key"
 COORD_INSIGHTS = "insights"
+COORD_INSIGHTS_VIEW = "insights_view"
 COORD_LOOKUP_EVENTTYPE = "eventtypes"
 COORD_PROPERTIES = "properties"
 COORD_PROPERTY = "property"
 COORD_READINGS = "readings"
+COORD_READINGS_VIEW = "readings_view"
+COORD_ROOM_DEVICES = "room_devices"
+COORD_STALE = "stale"
 DASHBOARD_URL = "https://dashboard.live.homelync.io/#/pages/portfolio/one-view"
 DOMAIN = "homelink"
 
 EVENTTYPE_INSIGHT = "INSIGHT"
 
-HOMELINK_ADD_DEVICE = f"{DOMAIN}_add_device"
-HOMELINK_ADD_PROPERTY = f"{DOMAIN}_add_property"
+HOMELINK_ADD_TOPOLOGY = f"{DOMAIN}_add_topology"
 HOMELINK_LOOKUP_EVENTTYPE = "eventType"
 HOMELINK_MESSAGE_EVENT = "{domain}_event_{key}"
 HOMELINK_MESSAGE_MQTT = "{domain}_mqtt_{key}"
+HOMELINK_PUSH_STATE = f"{DOMAIN}_push_state"
 
 HOMELINK_MQTT_PROTOCOL = "tcp"
 HOMELINK_MQTT_KEEPALIVE = 60
@@ -143,9 +148,18 @@ MQTT_SOURCEMODELTYPE = "sourceModelType"
 MQTT_STATUSID = "statusId"
 MQTT_VALUE = "value"
 
+READING_COUNT = "count"
+READING_DATE = "readingDate"
+READING_DEVICES = "devices"
+READING_SERIALNUMBER = "serialNumber"
+READING_TYPE = "type"
+READING_VALUE = "value"
+READING_VALUES = "values"
+
 READINGS_CO2 = "co2readings"
 READINGS_HUMIDITY = "humidityreadings"
 READINGS_TEMPERATURE = "temperaturereadings"
+READINGS_RETENTION_DAYS = 30
 READINGS_SENSOR_CO2 = "environment-co2-indoor"
 READINGS_SENSOR_ELECTRIC = "electricity-power-hour"
 READINGS_SENSOR_ELECTRIC_TARIFF = "tariff-electricity-power-hour"
@@ -159,7 +173,29 @@ READINGS_ENVIRONMENT = {
     READINGS_TEMPERATURE: READINGS_SENSOR_TEMPERATURE,
 }
 
+RETRIEVAL_CACHE_SIZE = 2048
+RETRIEVAL_INTERVAL_ALERTS = timedelta(seconds=30)
+RETRIEVAL_INTERVAL_ALERTS_PUSH = timedelta(minutes=5)
+RETRIEVAL_INTERVAL_INSIGHTS = timedelta(hours=1)
 RETRIEVAL_INTERVAL_READINGS = timedelta(minutes=5)
+RETRIEVAL_INTERVAL_TOPOLOGY = timedelta(minutes=15)
+RETRIEVAL_MAX_CONCURRENCY = 10
+RETRIEVAL_MAX_DAYS_PER_UPDATE = 4
+RETRIEVAL_PUSH_HEALTHY_WINDOW = timedelta(minutes=30)
+RETRIEVAL_RECENT_ALERT_WINDOW = timedelta(minutes=30)
+RETRIEVAL_REFRESH_WINDOW = timedelta(milliseconds=500)
+
+RETRY_ATTEMPT_TIMEOUT = timedelta(seconds=4)
+RETRY_ATTEMPTS = 2
+RETRY_BACKOFF_BASE = timedelta(milliseconds=500)
+RETRY_BACKOFF_MAX = timedelta(seconds=1)
+RETRY_BREAKER_RESET = timedelta(minutes=5)
+RETRY_BREAKER_THRESHOLD = 5
+
+SNAPSHOT_SAVE_DELAY = 60
+SNAPSHOT_VERSION = 1
+
+STATISTICS_IMPORT_CHUNK = 168
 
 SENSOR_TRANSLATION_KEY = {
     READINGS_SENSOR_ELECTRIC: "electricity",
@@ -194,3 +230,11 @@ class HomeLINKMessageType(StrEnum):
     MESSAGE_PROPERTY = "property"
     MESSAGE_READING = "reading"
     MESSAGE_UNKNOWN = "unknown"
+
+
+class HomeLINKBreakerState(StrEnum):
+    """HomeLINK API circuit breaker states."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
@@ -6,6 +6,8 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_ACCESS_TOKEN
 from homeassistant.core import HomeAssistant
 
+from .const import COORD_PROPERTIES, COORD_STALE
+from .helpers.api import AsyncConfigEntryAuth
 from .helpers.config_data import HLConfigEntry
 
 TO_REDACT = {CONF_ACCESS_TOKEN}
@@ -16,7 +18,24 @@ async def async_get_config_entry_diagnostics(
     entry: HLConfigEntry,
 ) -> dict:
     """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    auth = coordinator.hl_api.auth
     return {
         "config_entry_data": async_redact_data(dict(entry.data), TO_REDACT),
         "config_entry_options": dict(entry.options),
+        "coordinator": {
+            "api": coordinator.api_guard.as_dict(),
+            "cache": auth.cache.as_dict()
+            if isinstance(auth, AsyncConfigEntryAuth)
+            else None,
+            "property_failures": dict(coordinator.property_failures),
+            "skipped_writes": coordinator.skipped_writes,
+            "stale": {
+                hl_property_key: sorted(coord_property[COORD_STALE])
+                for hl_property_key, coord_property in coordinator.data[
+                    COORD_PROPERTIES
+                ].items()
+                if coord_property[COORD_STALE]
+            },
+        },
     }
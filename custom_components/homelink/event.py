@@ -18,13 +18,12 @@ from .const import (
     COORD_LOOKUP_EVENTTYPE,
     COORD_PROPERTIES,
     EVENTTYPE_INSIGHT,
-    HOMELINK_ADD_DEVICE,
-    HOMELINK_ADD_PROPERTY,
+    HOMELINK_ADD_TOPOLOGY,
     MODELLIST_ENERGY,
     MODELLIST_ENVIRONMENT,
 )
 from .helpers.config_data import HLConfigEntry
-from .helpers.coordinator import HomeLINKDataCoordinator
+from .helpers.coordinator import AddedDevice, HomeLINKDataCoordinator
 from .helpers.entity import HomeLINKEventEntity
 from .helpers.utils import (
     build_device_identifiers,
@@ -60,10 +59,10 @@ async def _async_create_entities(
     # - Property
     # - Device
 
-    @callback
-    def async_add_property(hl_property: str) -> None:
-        # Callback since this can be initiated post setup by coordinator
-        async_add_entities([HomeLINKPropertyEvent(entry, hl_property, eventtypes)])
+    def _property_entities(hl_property: str) -> list[HomeLINKEventEntity]:
+        entities: list[HomeLINKEventEntity] = [
+            HomeLINKPropertyEvent(entry, hl_property, eventtypes)
+        ]
         gateway_key = hl_coordinator.data[COORD_PROPERTIES][hl_property][
             COORD_GATEWAY_KEY
         ]
@@ -72,43 +71,52 @@ async def _async_create_entities(
             COORD_DEVICES
         ].items():
             if device.modeltype not in MODELLIST_ENERGY:
-                async_add_device(hl_property, device_key, device, gateway_key)
+                entities.append(
+                    _device_entity(hl_property, device_key, device, gateway_key)
+                )
+        return entities
 
-    @callback
-    def async_add_device(
+    def _device_entity(
         hl_property: str, device_key: str, device: Device, gateway_key: str
-    ) -> None:
-        # Callback since this can be initiated post setup by coordinator
+    ) -> HomeLINKEventEntity:
         eventtypes_device = (
             eventtypes
             if device.modeltype in MODELLIST_ENVIRONMENT
             else eventtypes_alarm
         )
-        async_add_entities(
-            [
-                HomeLINKDeviceEvent(
-                    entry,
-                    hl_property,
-                    device_key,
-                    device,
-                    gateway_key,
-                    eventtypes_device,
-                )
-            ]
+        return HomeLINKDeviceEvent(
+            entry,
+            hl_property,
+            device_key,
+            device,
+            gateway_key,
+            eventtypes_device,
         )
 
-    for hl_property in hl_coordinator.data[COORD_PROPERTIES]:
-        async_add_property(hl_property)
-
-    entry.async_on_unload(
-        async_dispatcher_connect(hass, HOMELINK_ADD_PROPERTY, async_add_property)
+    @callback
+    def async_add_topology(
+        hl_properties: list[str], added_devices: list[AddedDevice]
+    ) -> None:
+        # Callback since this can be initiated post setup by coordinator
+        entities = [
+            entity
+            for hl_property in hl_properties
+            for entity in _property_entities(hl_property)
+        ]
+        entities.extend(_device_entity(*added) for added in added_devices)
+        async_add_entities(entities)
+
+    # The entities for every property are added as a single batch
+    async_add_entities(
+        [
+            entity
+            for hl_property in hl_coordinator.data[COORD_PROPERTIES]
+            for entity in _property_entities(hl_property)
+        ]
     )
+
     entry.async_on_unload(
-        async_dispatcher_connect(
-            hass,
-            HOMELINK_ADD_DEVICE,
-            async_add_device,
-        )
+        async_dispatcher_connect(hass, HOMELINK_ADD_TOPOLOGY, async_add_topology)
     )
 
 
@@ -1,11 +1,27 @@
 """API access for HomeLINk service."""
 
-from typing import cast
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+import hashlib
+from typing import Any, cast
 
-from aiohttp import ClientSession
+from aiohttp import ClientResponse, ClientSession
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.util.json import json_loads
+from yarl import URL
 
 from pyhomelink import AbstractAuth
+from pyhomelink.const import BASE_URL
+
+from ..const import RETRIEVAL_CACHE_SIZE
+
+HEADER_ETAG = "ETag"
+HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_LAST_MODIFIED = "Last-Modified"
+HTTP_NOT_MODIFIED = 304
+HTTP_OK = 200
 
 
 class AsyncConfigEntryAuth(AbstractAuth):
@@ -17,7 +33,12 @@ class AsyncConfigEntryAuth(AbstractAuth):
         oauth_session: config_entry_oauth2_flow.OAuth2Session,
     ) -> None:
         """Initialize HomeLINK auth."""
-        super().__init__(websession)
+        self.cache = HomeLINKResponseCache()
+        # Requests are made by pyhomelink, through a session serving unchanged
+        # responses from the cache
+        super().__init__(
+            cast("ClientSession", HomeLINKCachingSession(websession, self.cache))
+        )
         self._oauth_session = oauth_session
 
     async def async_get_access_token(self) -> str:
@@ -26,3 +47,135 @@ class AsyncConfigEntryAuth(AbstractAuth):
             await self._oauth_session.async_ensure_token_valid()
 
         return cast("str", self._oauth_session.token["access_token"])
+
+
+@dataclass
+class _CacheEntry:
+    etag: str | None
+    last_modified: str | None
+    body_hash: bytes
+    payload: Any
+
+
+class CachedResponse:
+    """A successful response whose body has already been decoded."""
+
+    status = HTTP_OK
+
+    def __init__(self, url: URL, payload: Any) -> None:
+        """Initialise the response."""
+        self.url = url
+        self._payload = payload
+
+    async def json(self) -> Any:
+        """Return the decoded body."""
+        return self._payload
+
+
+class HomeLINKResponseCache:
+    """Decoded API responses, reused while the response is unchanged.
+
+    If the server sent an ETag or Last-Modified validator, it is sent back on
+    the next request, and a 304 response is served from the cache. Otherwise
+    the body is hashed, and an identical body is not decoded again.
+    """
+
+    def __init__(self, size: int = RETRIEVAL_CACHE_SIZE) -> None:
+        """Initialise the cache."""
+        self._size = size
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def conditional_headers(self, key: str) -> dict[str, str]:
+        """Return the validator headers for a cached response."""
+        if not (entry := self._entries.get(key)):
+            return {}
+        headers = {}
+        if entry.etag:
+            headers[HEADER_IF_NONE_MATCH] = entry.etag
+        if entry.last_modified:
+            headers[HEADER_IF_MODIFIED_SINCE] = entry.last_modified
+        return headers
+
+    async def async_process(
+        self, key: str, resp: ClientResponse
+    ) -> ClientResponse | CachedResponse:
+        """Return the response, decoded from the cache if it is unchanged."""
+        entry = self._entries.get(key)
+        if resp.status == HTTP_NOT_MODIFIED and entry:
+            return self._hit(key, resp, entry)
+        if resp.status != HTTP_OK:
+            return resp
+        body = await resp.read()
+        body_hash = hashlib.blake2b(body, digest_size=16).digest()
+        if entry and entry.body_hash == body_hash:
+            return self._hit(key, resp, entry)
+        self.misses += 1
+        entry = _CacheEntry(
+            resp.headers.get(HEADER_ETAG),
+            resp.headers.get(HEADER_LAST_MODIFIED),
+            body_hash,
+            json_loads(body),
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+        return CachedResponse(resp.url, entry.payload)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache counts for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _hit(
+        self, key: str, resp: ClientResponse, entry: _CacheEntry
+    ) -> CachedResponse:
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return CachedResponse(resp.url, entry.payload)
+
+
+class HomeLINKCachingSession:
+    """Client session that serves unchanged HomeLINK API responses from a cache.
+
+    GET requests to the API carry the validators of the cached response.
+    Readings are not cached, since past days are rarely requested again and
+    today's readings change on every poll, so they would only push the
+    topology, alerts and insights out of the cache.
+    """
+
+    def __init__(self, websession: ClientSession, cache: HomeLINKResponseCache) -> None:
+        """Initialise the session."""
+        self._websession = websession
+        self._cache = cache
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> ClientResponse | CachedResponse:
+        """Make a request, serving unchanged GET responses from the cache."""
+        if (
+            method.lower() != "get"
+            or not url.startswith(BASE_URL)
+            or "/readings" in url
+        ):
+            return await self._websession.request(
+                method, url, headers=headers, **kwargs
+            )
+        key = f"{url} {kwargs.get('params')}"
+        resp = await self._websession.request(
+            method,
+            url,
+            headers={**(headers or {}), **self._cache.conditional_headers(key)},
+            **kwargs,
+        )
+        return await self._cache.async_process(key, resp)
@@ -1,23 +1,30 @@
 """HomeLINK coordinators."""
 
 import asyncio
+import json
 import logging
+import operator
 import traceback
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from copy import deepcopy
-from datetime import date, datetime, timedelta
-from typing import Any
+from datetime import date, timedelta
+from typing import Any, NamedTuple, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from pyhomelink import HomeLINKApi
+from pyhomelink.alert import Alert
 from pyhomelink.device import Device
 from pyhomelink.exceptions import ApiException, AuthException
+from pyhomelink.insight import Insight
 from pyhomelink.lookup import Lookup, LookupEventType
 from pyhomelink.property import Property
 from pyhomelink.reading import PropertyReading
@@ -27,6 +34,7 @@ from ..const import (
     ATTR_HOMELINK,
     ATTR_PROPERTY,
     ATTR_READINGS,
+    CATEGORY_INSIGHT,
     CONF_INSIGHTS_ENABLE,
     COORD_ALERTS,
     COORD_CONFIG_ENTRY_OPTIONS,
@@ -37,28 +45,186 @@ from ..const import (
     COORD_PROPERTIES,
     COORD_PROPERTY,
     COORD_READINGS,
+    COORD_STALE,
     DASHBOARD_URL,
     DOMAIN,
-    HOMELINK_ADD_DEVICE,
-    HOMELINK_ADD_PROPERTY,
+    HOMELINK_ADD_TOPOLOGY,
     HOMELINK_LOOKUP_EVENTTYPE,
+    HOMELINK_PUSH_STATE,
     KNOWN_DEVICES_CHILDREN,
     KNOWN_DEVICES_DEVICEID,
     KNOWN_DEVICES_ID,
     KNOWN_DEVICES_MODEL,
     MODELTYPE_GATEWAY,
+    RETRIEVAL_INTERVAL_ALERTS,
+    RETRIEVAL_INTERVAL_ALERTS_PUSH,
+    RETRIEVAL_INTERVAL_INSIGHTS,
     RETRIEVAL_INTERVAL_READINGS,
+    RETRIEVAL_INTERVAL_TOPOLOGY,
+    RETRIEVAL_MAX_CONCURRENCY,
+    RETRIEVAL_PUSH_HEALTHY_WINDOW,
+    RETRIEVAL_RECENT_ALERT_WINDOW,
+    RETRIEVAL_REFRESH_WINDOW,
 )
-from .utils import include_property
+from .device_names import HomeLINKDeviceNames
+from .push import HomeLINKPushChannel
+from .readings import HomeLINKReadingsTracker
+from .refresh import HomeLINKRefreshScheduler, RefreshRequest
+from .retry import CircuitOpenException, HomeLINKApiGuard
+from .snapshot import HomeLINKSnapshot
+from .statistics import HomeLINKStatistics
+from .utils import include_property, raw_data
+from .views import update_views
 
 _LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
 
 
-class HomeLINKDataCoordinator(DataUpdateCoordinator):
-    """HomeLINK Data object."""
+class AddedDevice(NamedTuple):
+    """A device found on a property that already has its entities."""
+
+    hl_property_key: str
+    device_key: str
+    device: Device
+    gateway_key: str | None
+
+
+async def _async_run_together(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+    """Run coroutines concurrently, cancelling the others if one fails.
+
+    The first failure is re-raised on its own (rather than as an ExceptionGroup)
+    so callers can keep handling the specific HomeLINK exceptions.
+    """
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(coro) for coro in coros]
+    except ExceptionGroup as err_group:
+        raise err_group.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+def _set_stale(coord_property: dict[str, Any], tier: str, stale: bool) -> None:
+    if stale:
+        coord_property[COORD_STALE].add(tier)
+    else:
+        coord_property[COORD_STALE].discard(tier)
+
+
+class HomeLINKFingerprints:
+    """Fingerprints of the response data of pyhomelink objects, by key.
+
+    The response data identifies whether anything has changed. An unchanged
+    response is served from the response cache as the same decoded data, so if
+    every object's data is the same one as last time for the key, the last
+    fingerprint is returned without serialising the data again.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the fingerprints."""
+        self._last: dict[Any, tuple[tuple[Any, ...], int]] = {}
+
+    def fingerprint(self, key: Any, hl_objects: Iterable[Any]) -> int:
+        """Return the fingerprint of the objects' data."""
+        data = tuple(raw_data(hl_object) for hl_object in hl_objects)
+        last = self._last.get(key)
+        if last and len(last[0]) == len(data) and all(map(operator.is_, last[0], data)):
+            return last[1]
+        fingerprint = hash(json.dumps(data))
+        self._last[key] = (data, fingerprint)
+        return fingerprint
+
+
+def _gateway_key(devices: dict[str, Device]) -> str | None:
+    return next(
+        (
+            device.serialnumber
+            for device in devices.values()
+            if device.modeltype == MODELTYPE_GATEWAY
+        ),
+        None,
+    )
+
+
+def _fingerprints(
+    fingerprints: HomeLINKFingerprints,
+    hl_property: Property,
+    devices: dict[str, Device],
+) -> tuple[int, dict[str, int]]:
+    return fingerprints.fingerprint((hl_property.reference, None), [hl_property]), {
+        device_key: fingerprints.fingerprint(
+            (hl_property.reference, device_key), [device]
+        )
+        for device_key, device in devices.items()
+    }
+
+
+def _topology_changes(
+    hl_property_key: str,
+    previous: tuple[int, dict[str, int]] | None,
+    fingerprints: tuple[int, dict[str, int]],
+) -> set[tuple[str, str | None]]:
+    # Without a previous fingerprint, anything may have changed
+    if not previous:
+        return {(hl_property_key, None)} | {
+            (hl_property_key, device_key) for device_key in fingerprints[1]
+        }
+    changes: set[tuple[str, str | None]] = set()
+    if previous[0] != fingerprints[0]:
+        changes.add((hl_property_key, None))
+    changes.update(
+        (hl_property_key, device_key)
+        for device_key, fingerprint in fingerprints[1].items()
+        if device_key in previous[1] and previous[1][device_key] != fingerprint
+    )
+    return changes
+
+
+class HomeLINKChangeSetCoordinator(DataUpdateCoordinator):
+    """Coordinator that notifies only the entities affected by a change.
+
+    Entities listen with a (property key, device key) context, the device key
+    being None for property level entities. A change is either such a context,
+    or a property key, which affects every entity of that property.
+    """
+
+    _changes: set[Any] | None = None
+
+    @callback
+    def async_set_changes(self, changes: Iterable[Any]) -> None:
+        """Limit the next listener update to the entities affected by the changes."""
+        # After a failed update every entity is notified, so that availability
+        # is updated when it recovers
+        self._changes = set(changes) if self.last_update_success else None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners affected by the changes, or all of them."""
+        changes, self._changes = self._changes, None
+        if changes is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changes or context[0] in changes:
+                update_callback()
+
+
+class HomeLINKDataCoordinator(HomeLINKChangeSetCoordinator):
+    """HomeLINK Data object.
+
+    Refreshes the portfolio topology (properties and devices) and owns the merged
+    snapshot. Alerts, readings and insights are refreshed at their own rates by
+    tier coordinators, which merge their slice back into the snapshot.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, hl_api: HomeLINKApi, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        hl_api: HomeLINKApi,
+        entry: ConfigEntry,
+        *,
+        max_concurrency: int = RETRIEVAL_MAX_CONCURRENCY,
+        refresh_window: timedelta = RETRIEVAL_REFRESH_WINDOW,
+        api_guard: HomeLINKApiGuard | None = None,
     ) -> None:
         """Initialize HomeLINKDataCoordinator."""
         super().__init__(
@@ -66,18 +232,70 @@ class HomeLINKDataCoordinator(DataUpdateCoordinator):
             _LOGGER,
             config_entry=entry,
             name="HomeLINK",
-            update_interval=timedelta(seconds=30),
+            update_interval=RETRIEVAL_INTERVAL_TOPOLOGY,
             always_update=False,
         )
         self._hass = hass
-        self._hl_api = hl_api
+        self.hl_api = hl_api
         self._entry = entry
         self._known_properties: dict = {}
         self._device_registry = dr.async_get(hass)
         self._first_refresh = True
         self._eventtypes: list[Lookup] | list[LookupEventType] = []
         self._error = False
-        self._throttle = datetime.now() - RETRIEVAL_INTERVAL_READINGS
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.api_guard = api_guard or HomeLINKApiGuard()
+        # History backfill failures must not open the breaker for live polling
+        self._backfill_guard = HomeLINKApiGuard()
+        self._snapshot = HomeLINKSnapshot(hass, entry.entry_id)
+        self._readings = HomeLINKReadingsTracker()
+        self.device_names = HomeLINKDeviceNames(
+            hass, entry, self._async_devices_renamed
+        )
+        self._statistics = HomeLINKStatistics(
+            hass, entry, self._async_retrieve_readings_day
+        )
+        self.tiers: dict[str, HomeLINKTierCoordinator] = {
+            COORD_ALERTS: HomeLINKTierCoordinator(
+                hass,
+                self,
+                entry,
+                tier=COORD_ALERTS,
+                update_interval=RETRIEVAL_INTERVAL_ALERTS,
+                fetch=self._async_get_alerts,
+                interval=self._alerts_interval,
+            ),
+            COORD_READINGS: HomeLINKTierCoordinator(
+                hass,
+                self,
+                entry,
+                tier=COORD_READINGS,
+                update_interval=RETRIEVAL_INTERVAL_READINGS,
+                fetch=self._async_get_readings,
+            ),
+            COORD_INSIGHTS: HomeLINKTierCoordinator(
+                hass,
+                self,
+                entry,
+                tier=COORD_INSIGHTS,
+                update_interval=RETRIEVAL_INTERVAL_INSIGHTS,
+                fetch=self._async_get_insights,
+            ),
+        }
+        self._push_channels: list[HomeLINKPushChannel] = []
+        self._failing_properties: set[str] = set()
+        self.property_failures: Counter[str] = Counter()
+        self.skipped_writes = 0
+        self._fingerprints: dict[str, tuple[int, dict[str, int]]] = {}
+        self._topology_fingerprints = HomeLINKFingerprints()
+        self._refresh_scheduler = HomeLINKRefreshScheduler(
+            hass, refresh_window, self._async_refresh_requested
+        )
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass, HOMELINK_PUSH_STATE, self.tiers[COORD_ALERTS].async_adapt_interval
+            )
+        )
 
     async def _async_setup(self) -> None:
         # As a one off activity retrieve the eventtypes lookup
@@ -90,14 +308,78 @@ class HomeLINKDataCoordinator(DataUpdateCoordinator):
                 self._error = True
             raise ConfigEntryAuthFailed from auth_err
 
+    async def async_warm_start(self) -> bool:
+        """Set up from the last stored snapshot, returning False if there is none."""
+        if not (snapshot := await self._snapshot.async_load(self.hl_api.auth)):
+            return False
+        self._eventtypes = snapshot[COORD_LOOKUP_EVENTTYPE]
+        coord_properties = {
+            hl_property_key: coord_property
+            for hl_property_key, coord_property in snapshot[COORD_PROPERTIES].items()
+            if include_property(self._entry.options, hl_property_key)
+        }
+        for hl_property_key, coord_property in coord_properties.items():
+            self._readings.restore(hl_property_key, coord_property[COORD_READINGS])
+            # So that the first live refresh notifies what differs from the snapshot
+            self._fingerprints[hl_property_key] = _fingerprints(
+                self._topology_fingerprints,
+                coord_property[COORD_PROPERTY],
+                coord_property[COORD_DEVICES],
+            )
+            update_views(hl_property_key, coord_property)
+        await self._async_check_for_changes(coord_properties)
+        self.async_set_updated_data(
+            {
+                COORD_PROPERTIES: coord_properties,
+                COORD_LOOKUP_EVENTTYPE: self._eventtypes,
+                COORD_CONFIG_ENTRY_OPTIONS: self._entry.options,
+            }
+        )
+        return True
+
+    async def async_refresh_live(self) -> None:
+        """Refresh the topology and then every tier from the API."""
+        await self.async_refresh()
+        if self.last_update_success:
+            await _async_run_together(
+                *(tier.async_refresh() for tier in self.tiers.values())
+            )
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        self._snapshot.async_schedule_save(lambda: self.data)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
 
         # Retrieve the core data and then check if there are any changes in properties or devices
+        coord_properties = await self.async_fetch(self._async_get_core_data)
+        await self._async_check_for_changes(coord_properties)
+        if (
+            self.data
+            and coord_properties.keys() == self.data[COORD_PROPERTIES].keys()
+            and all(
+                coord_property is self.data[COORD_PROPERTIES][hl_property_key]
+                for hl_property_key, coord_property in coord_properties.items()
+            )
+        ):
+            # Nothing has changed, returning the same data means the listeners
+            # are not called
+            return self.data
+        self._async_save_snapshot()
+        config_entry = self._entry.options
 
+        return {
+            COORD_PROPERTIES: coord_properties,
+            COORD_LOOKUP_EVENTTYPE: self._eventtypes,
+            COORD_CONFIG_ENTRY_OPTIONS: config_entry,
+        }
+
+    async def async_fetch(self, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Call the HomeLINK API, translating failures for the coordinators."""
         try:
-            async with asyncio.timeout(10):
-                coord_properties = await self._async_get_core_data()
+            async with asyncio.timeout(10) as fetch_timeout:
+                result = await fetch()
 
         except AuthException as auth_err:
             if not self._error:
@@ -116,6 +398,9 @@ class HomeLINKDataCoordinator(DataUpdateCoordinator):
                 },
             ) from api_err
         except asyncio.TimeoutError as timeout_err:
+            if fetch_timeout.expired():
+                # An attempt cut short by the overall timeout is a failure too
+                self.api_guard.record_failure()
             err_traceback = traceback.format_exc()
             if not self._error:
                 _LOGGER.warning("Timeout communicating with HL API: %s", err_traceback)
@@ -127,92 +412,410 @@ class HomeLINKDataCoordinator(DataUpdateCoordinator):
                     "err_traceback": err_traceback,
                 },
             ) from timeout_err
-        await self._async_check_for_changes(coord_properties)
-        config_entry = self._entry.options
 
         self._error = False
-        return {
-            COORD_PROPERTIES: coord_properties,
-            COORD_LOOKUP_EVENTTYPE: self._eventtypes,
-            COORD_CONFIG_ENTRY_OPTIONS: config_entry,
+        return result
+
+    @callback
+    def async_add_push_channel(self, channel: HomeLINKPushChannel) -> None:
+        """Add a push channel whose health drives the alerts polling interval."""
+        self._push_channels.append(channel)
+        self.tiers[COORD_ALERTS].async_adapt_interval()
+
+    def _alerts_interval(self) -> timedelta:
+        # A healthy push channel delivers alerts as they happen, so poll less often.
+        # Poll at the normal rate if the channel is quiet/disconnected or while
+        # a (non insight) alert is recent, so that a quick clearance is picked up.
+        # A long running alert is left to the slower rate, so that it does not
+        # hold the whole portfolio at the normal rate.
+        if not any(
+            channel.is_healthy(RETRIEVAL_PUSH_HEALTHY_WINDOW)
+            for channel in self._push_channels
+        ):
+            return RETRIEVAL_INTERVAL_ALERTS
+        recent = dt_util.utcnow() - RETRIEVAL_RECENT_ALERT_WINDOW
+        if self.data and any(
+            alert.category != CATEGORY_INSIGHT and alert.raiseddate >= recent
+            for coord_property in self.data[COORD_PROPERTIES].values()
+            for alert in coord_property[COORD_ALERTS]
+        ):
+            return RETRIEVAL_INTERVAL_ALERTS
+        return RETRIEVAL_INTERVAL_ALERTS_PUSH
+
+    @callback
+    def _async_devices_renamed(self, serials: set[str]) -> None:
+        # Alarmed devices are listed by name on the property and alarm entities
+        if not self.data:
+            return
+        changes = {
+            (hl_property_key, None)
+            for hl_property_key, coord_property in self.data[COORD_PROPERTIES].items()
+            if any(
+                alert.serialnumber and alert.serialnumber.upper() in serials
+                for alert in coord_property[COORD_ALERTS]
+            )
+        }
+        if changes:
+            alerts_coordinator = self.tiers[COORD_ALERTS]
+            alerts_coordinator.async_set_changes(changes)
+            alerts_coordinator.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh on shutdown."""
+        await super().async_shutdown()
+        self._refresh_scheduler.async_cancel()
+
+    async def async_refresh_topology(self) -> bool:
+        """Request a full refresh, coalesced with other requests."""
+        return await self._refresh_scheduler.async_request(COORD_PROPERTIES)
+
+    async def async_refresh_property_alerts(self, hl_property_key: str) -> bool:
+        """Request a refresh of a single property's alerts."""
+        return await self._refresh_scheduler.async_request(
+            COORD_ALERTS, hl_property_key
+        )
+
+    async def async_refresh_property_devices(self, hl_property_key: str) -> bool:
+        """Request a refresh of a single property's devices."""
+        return await self._refresh_scheduler.async_request(
+            COORD_DEVICES, hl_property_key
+        )
+
+    async def _async_refresh_requested(self, requests: set[RefreshRequest]) -> bool:
+        # A property change (or a message for a property not in the snapshot)
+        # needs a full refresh, otherwise refresh the devices and alerts of just
+        # the properties concerned
+        if any(
+            kind == COORD_PROPERTIES or key not in self.data[COORD_PROPERTIES]
+            for kind, key in requests
+        ):
+            await self.async_refresh()
+            if not self.last_update_success:
+                return False
+            requests = {request for request in requests if request[0] == COORD_ALERTS}
+        coord_properties = self.data[COORD_PROPERTIES]
+        device_keys = {
+            key
+            for kind, key in requests
+            if kind == COORD_DEVICES and key in coord_properties
+        }
+        alert_keys = {
+            key
+            for kind, key in requests
+            if kind == COORD_ALERTS and key in coord_properties
         }
+        try:
+            if device_keys:
+                await self._async_refresh_devices(
+                    {key: coord_properties[key] for key in device_keys}
+                )
+            if alert_keys:
+                await self._async_refresh_alerts(
+                    {key: coord_properties[key] for key in alert_keys}
+                )
+        except ConfigEntryAuthFailed:
+            self._entry.async_start_reauth(self.hass)
+            return False
+        except UpdateFailed:
+            return False
+        return True
+
+    async def _async_refresh_alerts(self, coord_properties: dict[str, Any]) -> None:
+        alerts = await self.async_fetch(
+            lambda: self._async_get_alerts(coord_properties)
+        )
+        alerts_coordinator = self.tiers[COORD_ALERTS]
+        changed = alerts_coordinator.async_reuse_unchanged(alerts)
+        self.async_merge_tier(COORD_ALERTS, alerts, coord_properties)
+        if changed:
+            # The listeners are updated without rescheduling the next poll, so
+            # that push messages do not keep putting it off
+            alerts_coordinator.data = {**(alerts_coordinator.data or {}), **alerts}
+            alerts_coordinator.async_set_changes(changed)
+            alerts_coordinator.async_update_listeners()
+        # A pushed alert needs polling at the normal rate to pick up its clearance
+        alerts_coordinator.async_adapt_interval()
+
+    async def _async_refresh_devices(self, coord_properties: dict[str, Any]) -> None:
+        property_devices = await self.async_fetch(
+            lambda: self._async_get_per_property(
+                coord_properties,
+                lambda coord_property: coord_property[
+                    COORD_PROPERTY
+                ].async_get_devices(),
+            )
+        )
+        changes: set[tuple[str, str | None]] = set()
+        for hl_property_key, coord_property in coord_properties.items():
+            devices = property_devices.get(hl_property_key)
+            _set_stale(coord_property, COORD_DEVICES, devices is None)
+            if devices is None:
+                continue
+            coord_property[COORD_DEVICES] = {
+                device.serialnumber: device for device in devices
+            }
+            fingerprints = _fingerprints(
+                self._topology_fingerprints,
+                coord_property[COORD_PROPERTY],
+                coord_property[COORD_DEVICES],
+            )
+            changes.update(
+                _topology_changes(
+                    hl_property_key,
+                    self._fingerprints.get(hl_property_key),
+                    fingerprints,
+                )
+            )
+            self._fingerprints[hl_property_key] = fingerprints
+            coord_property[COORD_GATEWAY_KEY] = _gateway_key(
+                coord_property[COORD_DEVICES]
+            )
+            update_views(hl_property_key, coord_property, COORD_DEVICES)
+        await self._async_check_for_changes(self.data[COORD_PROPERTIES])
+        self._async_save_snapshot()
+        self.async_set_changes(changes)
+        self.async_update_listeners()
+
+    @callback
+    def async_merge_tier(
+        self, tier: str, tier_data: dict[str, Any], hl_property_keys: Iterable[str]
+    ) -> None:
+        """Merge a tier's per property data into the current snapshot.
+
+        Requested properties missing from the tier data failed to update, so they
+        keep their last good data and the tier is marked as stale.
+        """
+        if not self.data:
+            return
+        changed = False
+        for hl_property_key in hl_property_keys:
+            if coord_property := self.data[COORD_PROPERTIES].get(hl_property_key):
+                _set_stale(coord_property, tier, hl_property_key not in tier_data)
+                # Unchanged data has been replaced by the previous data
+                if (
+                    hl_property_key in tier_data
+                    and coord_property[tier] is not tier_data[hl_property_key]
+                ):
+                    coord_property[tier] = tier_data[hl_property_key]
+                    update_views(hl_property_key, coord_property, tier)
+                    changed = True
+        if changed:
+            self._async_save_snapshot()
 
     async def _async_get_core_data(self) -> Any:
-        # Use a self built throttle since readings method can be
-        # called once for each property and  we need them all to be retrieved
-        # - Get all properties
-        # - Get all devices
-        # - Get all insights
+        # - Get all properties and devices (in parallel)
         # - For each property
-        #   - Get readings (throttled)
-        #   - Get alerts
-        throttle = self._check_throttle()
-        properties = await self._hl_api.async_get_properties()
-        devices = await self._hl_api.async_get_devices()
-        insights = (
-            await self._hl_api.async_get_insights()
-            if self._entry.options.get(CONF_INSIGHTS_ENABLE)
-            else []
+        #   - Group its devices and identify the gateway
+        #   - Carry over alerts, readings and insights from the last snapshot or,
+        #     for a new property, retrieve them now (concurrently). A new property
+        #     that fails is left out, to be picked up as new on the next refresh
+        properties, devices = await _async_run_together(
+            self.api_guard.async_call(self.hl_api.async_get_properties),
+            self.api_guard.async_call(self.hl_api.async_get_devices),
         )
-        coord_properties = {}
+        # Group devices by property in a single pass so the per property join
+        # is a lookup rather than a scan of every device
+        property_devices: dict[str, dict[str, Device]] = defaultdict(dict)
+        for device in devices:
+            property_devices[device.rel.hl_property][device.serialnumber] = device
+
+        previous = self.data[COORD_PROPERTIES] if self.data else {}
+        changes: set[tuple[str, str | None]] = set()
+        coord_properties: dict[str, Any] = {}
+        new_properties: dict[str, Any] = {}
         for hl_property in properties:
             if not include_property(self._entry.options, hl_property.reference):
                 continue
-            property_devices = {
-                device.serialnumber: device
-                for device in devices
-                if device.rel.hl_property == hl_property.rel.self
-            }
-            gateway_key = next(
-                (
-                    device.serialnumber
-                    for device in property_devices.values()
-                    if device.modeltype == MODELTYPE_GATEWAY
-                ),
-                None,
+            devices_for_property = property_devices.get(hl_property.rel.self, {})
+            fingerprints = _fingerprints(
+                self._topology_fingerprints, hl_property, devices_for_property
             )
-            property_insights = [
-                insight
-                for insight in insights
-                if insight.rel.hl_property == hl_property.rel.self
-            ]
-            readings: list[PropertyReading] = []
-            if not throttle:
-                readings = await self._async_retrieve_readings(
-                    hl_property, property_devices
+            known_fingerprints = self._fingerprints.get(hl_property.reference)
+            if (
+                known_property := previous.get(hl_property.reference)
+            ) and known_fingerprints == fingerprints:
+                # Unchanged, so keep the existing data for the property
+                coord_properties[hl_property.reference] = known_property
+                continue
+            if known_property:
+                changes.update(
+                    _topology_changes(
+                        hl_property.reference, known_fingerprints, fingerprints
+                    )
                 )
-            coord_properties[hl_property.reference] = {
-                COORD_GATEWAY_KEY: gateway_key,
+            self._fingerprints[hl_property.reference] = fingerprints
+            coord_property = {
+                COORD_GATEWAY_KEY: _gateway_key(devices_for_property),
                 COORD_PROPERTY: hl_property,
-                COORD_DEVICES: property_devices,
-                COORD_INSIGHTS: property_insights,
-                COORD_ALERTS: await hl_property.async_get_alerts(),
-                COORD_READINGS: readings,
+                COORD_DEVICES: devices_for_property,
             }
+            if known_property:
+                # The tiers, their views and staleness carry over
+                coord_property = {**known_property, **coord_property}
+                update_views(hl_property.reference, coord_property, COORD_DEVICES)
+            else:
+                coord_property[COORD_STALE] = set()
+                new_properties[hl_property.reference] = coord_property
+            coord_properties[hl_property.reference] = coord_property
+
+        if new_properties:
+            tier_data = await _async_run_together(
+                *(self.tiers[tier].fetch(new_properties) for tier in self.tiers)
+            )
+            for tier, data in zip(self.tiers, tier_data, strict=True):
+                for hl_property_key, coord_property in new_properties.items():
+                    if hl_property_key in data:
+                        coord_property[tier] = data[hl_property_key]
+                    else:
+                        coord_properties.pop(hl_property_key, None)
+            for hl_property_key, coord_property in new_properties.items():
+                if hl_property_key in coord_properties:
+                    update_views(hl_property_key, coord_property)
 
+        self.async_set_changes(changes)
         return coord_properties
 
+    async def _async_get_alerts(
+        self, coord_properties: dict[str, Any]
+    ) -> dict[str, list[Alert]]:
+        return await self._async_get_per_property(
+            coord_properties,
+            lambda coord_property: coord_property[COORD_PROPERTY].async_get_alerts(),
+        )
+
+    async def _async_get_readings(
+        self, coord_properties: dict[str, Any]
+    ) -> dict[str, list[PropertyReading]]:
+        return await self._async_get_per_property(
+            coord_properties,
+            lambda coord_property: self._async_retrieve_readings(
+                coord_property[COORD_PROPERTY], coord_property[COORD_DEVICES]
+            ),
+        )
+
+    async def _async_get_insights(
+        self, coord_properties: dict[str, Any]
+    ) -> dict[str, list[Insight]]:
+        property_insights: dict[str, list[Insight]] = {
+            hl_property_key: [] for hl_property_key in coord_properties
+        }
+        if not self._entry.options.get(CONF_INSIGHTS_ENABLE):
+            return property_insights
+        property_rels = {
+            coord_property[COORD_PROPERTY].rel.self: hl_property_key
+            for hl_property_key, coord_property in coord_properties.items()
+        }
+        for insight in await self.api_guard.async_call(self.hl_api.async_get_insights):
+            if hl_property_key := property_rels.get(insight.rel.hl_property):
+                property_insights[hl_property_key].append(insight)
+        return property_insights
+
+    async def _async_get_per_property(
+        self,
+        coord_properties: dict[str, Any],
+        fetch: Callable[[dict[str, Any]], Awaitable[_T]],
+    ) -> dict[str, _T]:
+        # Per property API calls run concurrently, sharing a semaphore so that
+        # large portfolios do not flood the API.
+        # A failing property is counted and left out of the result, so the rest
+        # still update. Only if every property fails is the error raised.
+        # Calls refused by the open circuit breaker are not property failures,
+        # so the whole cycle fails once instead.
+        failures: dict[str, ApiException] = {}
+        rejected: list[CircuitOpenException] = []
+
+        async def _async_fetch_property(
+            hl_property_key: str, coord_property: dict[str, Any]
+        ) -> _T | None:
+            async with self._semaphore:
+                try:
+                    result = await self.api_guard.async_call(
+                        lambda: fetch(coord_property)
+                    )
+                except CircuitOpenException as open_err:
+                    rejected.append(open_err)
+                    return None
+                except ApiException as api_err:
+                    failures[hl_property_key] = api_err
+                    self.property_failures[hl_property_key] += 1
+                    if hl_property_key not in self._failing_properties:
+                        _LOGGER.warning(
+                            "Error retrieving data for property %s: %s",
+                            hl_property_key,
+                            api_err,
+                        )
+                        self._failing_properties.add(hl_property_key)
+                    return None
+            self._failing_properties.discard(hl_property_key)
+            return result
+
+        results = await _async_run_together(
+            *(
+                _async_fetch_property(hl_property_key, coord_property)
+                for hl_property_key, coord_property in coord_properties.items()
+            )
+        )
+        if rejected:
+            raise rejected[0]
+        if failures and len(failures) == len(coord_properties):
+            raise next(iter(failures.values()))
+        return {
+            hl_property_key: result
+            for hl_property_key, result in zip(coord_properties, results, strict=True)
+            if hl_property_key not in failures
+        }
+
     async def _async_retrieve_readings(
         self, hl_property: Property, property_devices: dict[str, Device]
     ) -> list[PropertyReading]:
-        readings = []
-        for device in property_devices.values():
-            if hasattr(device.rel, ATTR_READINGS):
-                readings = await hl_property.async_get_readings(date.today())
-                break
-        return readings
+        # Only the readings newer than those already seen are processed.
+        # Days missed since the last retrieval are retrieved a few per update,
+        # along with today, one after another so that a gap does not add to the
+        # number of API calls in flight.
+        if not any(
+            hasattr(device.rel, ATTR_READINGS) for device in property_devices.values()
+        ):
+            return []
+        today = date.today()
+        days = self._readings.days_to_fetch(hl_property.reference, today)
+        missed_days = days[:-1]
+        if missed_days and missed_days[0] < today - timedelta(days=1):
+            _LOGGER.info(
+                "Retrieving missed readings from %s to %s for %s",
+                missed_days[0],
+                missed_days[-1],
+                hl_property.reference,
+            )
+        day_readings = [await hl_property.async_get_readings(day) for day in days]
+        # Hours before the last one imported are skipped, so today is held back
+        # from the statistics while there are still missed days to import
+        if missed_days and missed_days[-1] < today - timedelta(days=1):
+            import_readings = day_readings[:-1]
+        else:
+            import_readings = day_readings
+        self._statistics.async_schedule_import(
+            hl_property,
+            [reading for readings in import_readings for reading in readings],
+        )
+        return self._readings.update(
+            hl_property.reference,
+            [reading for readings in day_readings for reading in readings],
+            days,
+            today,
+        )
+
+    async def _async_retrieve_readings_day(
+        self, hl_property: Property, day: date
+    ) -> list[PropertyReading]:
+        return await self._backfill_guard.async_call(
+            lambda: hl_property.async_get_readings(day)
+        )
 
     async def _async_get_eventtypes_lookup(self) -> None:
-        self._eventtypes = await self._hl_api.async_get_lookups(
-            HOMELINK_LOOKUP_EVENTTYPE
+        self._eventtypes = await self.api_guard.async_call(
+            lambda: self.hl_api.async_get_lookups(HOMELINK_LOOKUP_EVENTTYPE)
         )
 
-    def _check_throttle(self) -> bool:
-        if datetime.now() >= self._throttle + RETRIEVAL_INTERVAL_READINGS:
-            self._throttle = datetime.now()
-            return False
-        return True
-
     async def _async_check_for_changes(self, coord_properties: dict[str, Any]) -> None:
         if not self._known_properties:
             self._build_known_properties()
@@ -295,30 +898,30 @@ class HomeLINKDataCoordinator(DataUpdateCoordinator):
 
         new_properties = []
         if not self._first_refresh:
-            added = False
+            added_devices: list[AddedDevice] = []
             for hl_property_key, hl_property in coord_properties.items():
                 if hl_property_key not in known_properties:
                     new_properties.append(hl_property_key)
-                    dispatcher_send(self.hass, HOMELINK_ADD_PROPERTY, hl_property_key)
-                    added = True
                 else:
-                    for device_key, device in hl_property[COORD_DEVICES].items():
-                        if (
-                            device_key
-                            not in self._known_properties[hl_property_key][
-                                KNOWN_DEVICES_CHILDREN
-                            ]
-                        ):
-                            dispatcher_send(
-                                self.hass,
-                                HOMELINK_ADD_DEVICE,
-                                hl_property_key,
-                                device_key,
-                                device,
-                                hl_property[COORD_GATEWAY_KEY],
-                            )
-                            added = True
-            if added:
+                    added_devices.extend(
+                        AddedDevice(
+                            hl_property_key,
+                            device_key,
+                            device,
+                            hl_property[COORD_GATEWAY_KEY],
+                        )
+                        for device_key, device in hl_property[COORD_DEVICES].items()
+                        if device_key
+                        not in self._known_properties[hl_property_key][
+                            KNOWN_DEVICES_CHILDREN
+                        ]
+                    )
+            # All the additions go out as one signal, so each platform adds
+            # their entities in a single batch
+            if new_properties or added_devices:
+                dispatcher_send(
+                    self.hass, HOMELINK_ADD_TOPOLOGY, new_properties, added_devices
+                )
                 self._known_properties = {}
         else:
             new_properties.extend(iter(coord_properties))
@@ -342,3 +945,82 @@ class HomeLINKDataCoordinator(DataUpdateCoordinator):
         for entity in entities:
             entity_registry.async_remove(entity.entity_id)
         self._device_registry.async_remove_device(device)
+
+
+class HomeLINKTierCoordinator(HomeLINKChangeSetCoordinator):
+    """HomeLINK coordinator for one tier of the property data.
+
+    Notifies only the entities that depend on its tier, at its own rate.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        parent: HomeLINKDataCoordinator,
+        entry: ConfigEntry,
+        *,
+        tier: str,
+        update_interval: timedelta,
+        fetch: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+        interval: Callable[[], timedelta] | None = None,
+    ) -> None:
+        """Initialize HomeLINKTierCoordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"HomeLINK {tier}",
+            update_interval=update_interval,
+            always_update=False,
+        )
+        self._parent = parent
+        self._tier = tier
+        self._interval = interval
+        self._fingerprints: dict[str, int] = {}
+        self._tier_fingerprints = HomeLINKFingerprints()
+        self.fetch = fetch
+
+    @callback
+    def async_adapt_interval(self) -> None:
+        """Recalculate an adaptive interval, rescheduling the refresh if it changed."""
+        if not self._interval:
+            return
+        interval = self._interval()
+        if interval != self.update_interval:
+            self.update_interval = interval
+            if self._listeners:
+                self._schedule_refresh()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the tier for every property and merge it into the snapshot."""
+        if self._interval:
+            # Applies to the next scheduled refresh
+            self.update_interval = self._interval()
+        coord_properties = self._parent.data[COORD_PROPERTIES]
+        tier_data = await self._parent.async_fetch(lambda: self.fetch(coord_properties))
+        self.async_set_changes(self.async_reuse_unchanged(tier_data))
+        self._parent.async_merge_tier(self._tier, tier_data, coord_properties)
+        return tier_data
+
+    @callback
+    def async_reuse_unchanged(self, tier_data: dict[str, Any]) -> set[str]:
+        """Replace unchanged property data with the previous data.
+
+        Each property's data is fingerprinted, and if it matches the last
+        fingerprint the previous data is used instead. When nothing has changed
+        the tier data then equals the previous data, so the listeners are not
+        called. Returns the keys of the properties whose data changed.
+        """
+        changed = set()
+        for hl_property_key, data in tier_data.items():
+            fingerprint = self._tier_fingerprints.fingerprint(hl_property_key, data)
+            if (
+                self.data
+                and hl_property_key in self.data
+                and self._fingerprints.get(hl_property_key) == fingerprint
+            ):
+                tier_data[hl_property_key] = self.data[hl_property_key]
+            else:
+                self._fingerprints[hl_property_key] = fingerprint
+                changed.add(hl_property_key)
+        return changed
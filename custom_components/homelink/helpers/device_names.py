@@ -0,0 +1,74 @@
+"""Cached display names of HomeLINK devices."""
+
+from collections.abc import Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from ..const import DOMAIN
+from .utils import build_device_identifiers
+
+
+class HomeLINKDeviceNames:
+    """Device registry names of the HomeLINK devices, by serial number.
+
+    Each name is looked up in the device registry once and then cached. When
+    a device is created, renamed or removed in the registry its name is
+    dropped from the cache, and the serial numbers are passed to on_change so
+    that the entities listing alarmed devices can be updated.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        on_change: Callable[[set[str]], None],
+    ) -> None:
+        """Initialise the device names."""
+        self._dev_reg = dr.async_get(hass)
+        self._names: dict[str, str | None] = {}
+        self._on_change = on_change
+        entry.async_on_unload(
+            hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_registry_updated,
+                event_filter=_is_name_change,
+            )
+        )
+
+    def get(self, serialnumber: str) -> str | None:
+        """Return the name of a device, as set by the user if it has been."""
+        key = serialnumber.upper()
+        if key not in self._names:
+            device = self._dev_reg.async_get_device(
+                build_device_identifiers(serialnumber)
+            )
+            self._names[key] = (device.name_by_user or device.name) if device else None
+        return self._names[key]
+
+    @callback
+    def _async_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        if event.data["action"] == "remove":
+            identifiers = event.data["device"]["identifiers"]
+        elif device := self._dev_reg.async_get(event.data["device_id"]):
+            identifiers = device.identifiers
+        else:
+            return  # pragma: no cover
+        serials = {
+            identifier[1] for identifier in identifiers if identifier[0] == DOMAIN
+        } & self._names.keys()
+        if not serials:
+            return
+        for serial in serials:
+            del self._names[serial]
+        self._on_change(serials)
+
+
+@callback
+def _is_name_change(event_data: dr.EventDeviceRegistryUpdatedData) -> bool:
+    if event_data["action"] != "update":
+        return True
+    return bool(event_data["changes"].keys() & {"name", "name_by_user"})
@@ -7,6 +7,7 @@ from homeassistant.components.event import EventEntity
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -43,8 +44,60 @@ from .utils import (
 )
 
 
+# Base for all coordinator entities
+class HomeLINKCoordinatorEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
+    """HomeLINK Coordinator Entity.
+
+    Bound to the topology coordinator and also listens to each data tier
+    (alerts, readings, insights) it declares in _coordinator_tiers. The context
+    is (property key, device key), so the coordinators only notify the entity
+    of changes to its own property or device.
+
+    On a coordinator update the state is only written if the state, attributes
+    or availability differ from the last write, which is tracked as a digest.
+    """
+
+    _coordinator_tiers: tuple[str, ...] = ()
+    _state_digest: int | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return super().available and all(
+            self.coordinator.tiers[tier].last_update_success
+            for tier in self._coordinator_tiers
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Register tier coordinator listeners."""
+        await super().async_added_to_hass()
+        for tier in self._coordinator_tiers:
+            self.async_on_remove(
+                self.coordinator.tiers[tier].async_add_listener(
+                    self._handle_coordinator_update, self.coordinator_context
+                )
+            )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, forgetting the digest of the last coordinator write."""
+        self._state_digest = None
+        super().async_write_ha_state()
+
+    @callback
+    def _async_write_changed_state(self) -> None:
+        digest = hash(
+            (self.available, json_bytes([self.state, self.extra_state_attributes]))
+        )
+        if digest == self._state_digest:
+            self.coordinator.skipped_writes += 1
+            return
+        self.async_write_ha_state()
+        self._state_digest = digest
+
+
 # Supports binary_sensor and sensor for Alarm type entity
-class HomeLINKAlarmEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
+class HomeLINKAlarmEntity(HomeLINKCoordinatorEntity):
     """HomeLINK Property Entity."""
 
     _attr_attribution = ATTRIBUTION
@@ -56,7 +109,7 @@ class HomeLINKAlarmEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
         alarm_type: str,
     ) -> None:
         """Property entity object for HomeLINK sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(hl_property_key, None))
         self._key = hl_property_key
         self._property = self.coordinator.data[COORD_PROPERTIES][self._key]
         self._gateway_key = self._property[COORD_GATEWAY_KEY]
@@ -77,7 +130,7 @@ class HomeLINKAlarmEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
         self._update_attributes()
-        self.async_write_ha_state()
+        self._async_write_changed_state()
 
     @abstractmethod
     def _update_attributes(self) -> None:
@@ -89,7 +142,7 @@ class HomeLINKAlarmEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
 
 
 # Supports binary_sensor and sensor for Device type entity
-class HomeLINKDeviceEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
+class HomeLINKDeviceEntity(HomeLINKCoordinatorEntity):
     """HomeLINK Device Entity."""
 
     _attr_attribution = ATTRIBUTION
@@ -101,7 +154,7 @@ class HomeLINKDeviceEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
         device_key: str,
     ) -> None:
         """Device entity object for HomeLINK sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(hl_property_key, device_key))
         self._parent_key = hl_property_key
         self._key = device_key
         self._device = self.coordinator.data[COORD_PROPERTIES][self._parent_key][
@@ -127,7 +180,7 @@ class HomeLINKDeviceEntity(CoordinatorEntity[HomeLINKDataCoordinator]):
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
         self._update_attributes()
-        self.async_write_ha_state()
+        self._async_write_changed_state()
 
     @abstractmethod
     def _update_attributes(self) -> None:
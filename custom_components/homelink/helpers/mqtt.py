@@ -34,6 +34,7 @@ from ..const import (
     MQTT_INSIGHTID,
     HomeLINKMessageType,
 )
+from .push import HomeLINKPushChannel
 
 _LOGGER = logging.getLogger(__name__)
 MQTT_TIMEOUT = 5
@@ -42,7 +43,7 @@ SUBSCRIBE_ERROR = "subscribe"
 OTHER_ERROR = "other"
 
 
-class HomeLINKMQTT:
+class HomeLINKMQTT(HomeLINKPushChannel):
     """HomeLINK MQTT client."""
 
     def __init__(self, hass: HomeAssistant, options, properties=None) -> None:
@@ -92,6 +93,7 @@ class HomeLINKMQTT:
         self._client.unsubscribe(self._mqtt_root_topic)
         self._client.disconnect()
         self._client.loop_stop()
+        self._set_connected(self._hass, False)
 
     async def async_try_connect(self) -> str | None:
         """Try the connection."""
@@ -139,6 +141,7 @@ class HomeLINKMQTT:
 
     @callback
     def _on_disconnect(self, client, userdata, ret, properties=None) -> None:  # pylint: disable=unused-argument
+        self._set_connected(self._hass, False)
         if ret != paho_mqtt.MQTT_ERR_SUCCESS:
             if not self._connected:
                 self._check_error(
@@ -155,6 +158,7 @@ class HomeLINKMQTT:
 
     @callback
     async def _on_message(self, client, userdata, msg) -> None:  # pylint: disable=unused-argument
+        self._record_message()
         await _async_forward_message(
             self._hass, msg, self._root_topic, self._properties
         )
@@ -166,6 +170,7 @@ class HomeLINKMQTT:
             self._error = False
         self._result.put(True)
         self._subscribed = True
+        self._set_connected(self._hass, True)
 
     def _check_error(self, error_type: str, error_message: str, ret: Any) -> None:
         err_type = "unspecified"
@@ -179,7 +184,7 @@ class HomeLINKMQTT:
             self._error = error_type
 
 
-class HAMQTT:
+class HAMQTT(HomeLINKPushChannel):
     """HA MQTT Client."""
 
     def __init__(
@@ -194,6 +199,7 @@ class HAMQTT:
         self._mqtt_root_topic = f"{self._root_topic}/#"
         self._properties = properties
         self._unsubscribe_task: Callable[[], None] | None = None
+        self._unsubscribe_status: Callable[[], None] | None = None
 
     async def async_start(self) -> None:
         """Start up the MQTT client."""
@@ -203,6 +209,9 @@ class HAMQTT:
         """Stop up the MQTT client."""
         _LOGGER.debug("HA MQTT unsubscribed: %s", self._mqtt_root_topic)
         self._unsubscribe_task()  # type: ignore[misc]
+        if self._unsubscribe_status:
+            self._unsubscribe_status()
+        self._set_connected(self._hass, False)
 
     @callback
     async def _async_subscribe(
@@ -214,9 +223,20 @@ class HAMQTT:
         self._unsubscribe_task = await mqtt.async_subscribe(
             self._hass, self._mqtt_root_topic, self._async_message_received, qos=2
         )
+        # Follow the broker connection, so that push is not treated as healthy
+        # while HA MQTT is disconnected
+        self._unsubscribe_status = mqtt.async_subscribe_connection_status(
+            self._hass, self._async_connection_status
+        )
+        self._set_connected(self._hass, mqtt.is_connected(self._hass))
+
+    @callback
+    def _async_connection_status(self, connected: bool) -> None:
+        self._set_connected(self._hass, connected)
 
     @callback
     async def _async_message_received(self, msg: Any) -> None:
+        self._record_message()
         await _async_forward_message(
             self._hass, msg, self._root_topic, self._properties
         )
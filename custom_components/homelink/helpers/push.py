@@ -0,0 +1,37 @@
+"""Push channel health tracking for HomeLINK."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.util import dt as dt_util
+
+from ..const import HOMELINK_PUSH_STATE
+
+
+class HomeLINKPushChannel:
+    """Health of a push channel (MQTT or webhook).
+
+    Records when the last message arrived and whether the channel is connected.
+    A change in connection state is signalled so polling can be adapted.
+    """
+
+    connected: bool = False
+    last_message: datetime | None = None
+
+    def is_healthy(self, window: timedelta) -> bool:
+        """Return True if connected and a message has arrived within the window."""
+        return (
+            self.connected
+            and self.last_message is not None
+            and dt_util.utcnow() - self.last_message < window
+        )
+
+    def _record_message(self) -> None:
+        self.last_message = dt_util.utcnow()
+
+    def _set_connected(self, hass: HomeAssistant, connected: bool) -> None:
+        # dispatcher_send is thread safe, paho calls back from its own thread
+        if connected != self.connected:
+            self.connected = connected
+            dispatcher_send(hass, HOMELINK_PUSH_STATE)
@@ -0,0 +1,141 @@
+"""Incremental readings processing for HomeLINK."""
+
+from datetime import date, timedelta
+from typing import Any
+
+from pyhomelink.reading import PropertyReading
+
+from ..const import (
+    READING_COUNT,
+    READING_DATE,
+    READING_DEVICES,
+    READING_SERIALNUMBER,
+    READING_TYPE,
+    READING_VALUES,
+    READINGS_RETENTION_DAYS,
+    RETRIEVAL_MAX_DAYS_PER_UPDATE,
+)
+from .utils import raw_data
+
+
+class HomeLINKReadingsTracker:
+    """Newest reading per property, reading type and device.
+
+    The readings API only returns whole days, so the payload grows through the
+    day. Each device's values are compared against the newest reading date
+    already seen (as raw ISO strings, so nothing is parsed) and only a newer
+    value replaces it. The coordinator then holds just the newest value for
+    each device rather than the whole day. When nothing is newer, the same
+    readings as last time are returned.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the tracker."""
+        self._latest: dict[str, dict[str, dict[str, Any]]] = {}
+        self._fetched_day: dict[str, date] = {}
+        self._returned: dict[str, list[PropertyReading]] = {}
+
+    def days_to_fetch(self, hl_property_key: str, today: date) -> list[date]:
+        """Return the days to retrieve readings for, oldest first.
+
+        Every day since the last one retrieved is included (as far back as the
+        API holds readings), so days missed while Home Assistant was down are
+        filled in. This also means that on the first retrieval after midnight
+        the previous day is retrieved once more, so that readings published
+        late on that day are not lost. A long gap is filled in a few days per
+        update, so that each update stays within the retrieval timeout, and
+        today is always retrieved so that current readings are not held back.
+        """
+        fetched_day = self._fetched_day.get(hl_property_key)
+        if not fetched_day or fetched_day >= today:
+            return [today]
+        first_day = max(fetched_day, today - timedelta(days=READINGS_RETENTION_DAYS))
+        missed_days = min((today - first_day).days, RETRIEVAL_MAX_DAYS_PER_UPDATE - 1)
+        return [first_day + timedelta(days=offset) for offset in range(missed_days)] + [
+            today
+        ]
+
+    def restore(self, hl_property_key: str, readings: list[PropertyReading]) -> None:
+        """Restore the newest readings from a snapshot.
+
+        The day of the newest reading becomes the last day retrieved, so the
+        days since then are retrieved on the next update.
+        """
+        self._returned.pop(hl_property_key, None)
+        latest = self._latest.setdefault(hl_property_key, {})
+        reading_dates = []
+        for reading in readings:
+            raw = raw_data(reading)
+            latest[raw[READING_TYPE]] = {
+                **raw,
+                READING_DEVICES: {
+                    device[READING_SERIALNUMBER]: device
+                    for device in raw[READING_DEVICES]
+                    if device[READING_VALUES]
+                },
+            }
+            reading_dates.extend(
+                device[READING_VALUES][0][READING_DATE]
+                for device in raw[READING_DEVICES]
+                if device[READING_VALUES]
+            )
+        if reading_dates:
+            self._fetched_day[hl_property_key] = date.fromisoformat(
+                max(reading_dates)[:10]
+            )
+
+    def update(
+        self,
+        hl_property_key: str,
+        readings: list[PropertyReading],
+        days: list[date],
+        today: date,
+    ) -> list[PropertyReading]:
+        """Merge retrieved readings and return the newest value for each device.
+
+        A past day is complete once retrieved, so the next update carries on
+        from the day after the last missed day retrieved. Today is retrieved
+        again until it has passed.
+        """
+        self._fetched_day[hl_property_key] = (
+            min(days[-2] + timedelta(days=1), today) if len(days) > 1 else today
+        )
+        latest = self._latest.setdefault(hl_property_key, {})
+        changed = hl_property_key not in self._returned
+        for reading in readings:
+            raw = raw_data(reading)
+            if raw[READING_TYPE] not in latest:
+                latest[raw[READING_TYPE]] = {**raw, READING_DEVICES: {}}
+                changed = True
+            latest_reading = latest[raw[READING_TYPE]]
+            latest_devices = latest_reading[READING_DEVICES]
+            for device in raw[READING_DEVICES]:
+                known = latest_devices.get(device[READING_SERIALNUMBER])
+                watermark = known[READING_VALUES][0][READING_DATE] if known else ""
+                newest = max(
+                    (
+                        value
+                        for value in device[READING_VALUES]
+                        if value[READING_DATE] > watermark
+                    ),
+                    key=lambda value: value[READING_DATE],
+                    default=None,
+                )
+                if newest:
+                    latest_devices[device[READING_SERIALNUMBER]] = {
+                        **device,
+                        READING_COUNT: 1,
+                        READING_VALUES: [newest],
+                    }
+                    changed = True
+        if changed:
+            self._returned[hl_property_key] = [
+                PropertyReading(
+                    {
+                        **latest_reading,
+                        READING_DEVICES: list(latest_reading[READING_DEVICES].values()),
+                    }
+                )
+                for latest_reading in latest.values()
+            ]
+        return self._returned[hl_property_key]
@@ -0,0 +1,71 @@
+"""Coalesced refresh scheduling for HomeLINK."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+
+RefreshRequest = tuple[str, str | None]
+
+
+class HomeLINKRefreshScheduler:
+    """Debounced, single flight refresh scheduler.
+
+    Requests made within the window are collapsed into a single call of the
+    refresh function, which is passed everything that was requested. Callers
+    await the shared result. Only one refresh runs at a time, requests made
+    while it is running are collected for the next one.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: timedelta,
+        refresh: Callable[[set[RefreshRequest]], Awaitable[bool]],
+    ) -> None:
+        """Initialise the scheduler."""
+        self._hass = hass
+        self._window = window.total_seconds()
+        self._refresh = refresh
+        self._lock = asyncio.Lock()
+        self._pending: set[RefreshRequest] = set()
+        self._future: asyncio.Future[bool] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def async_request(self, kind: str, key: str | None = None) -> bool:
+        """Request a refresh and wait for the shared result."""
+        self._pending.add((kind, key))
+        if not self._future:
+            self._future = self._hass.loop.create_future()
+            self._timer = self._hass.loop.call_later(self._window, self._async_fire)
+        return await asyncio.shield(self._future)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel any scheduled refresh."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._future:
+            self._future.cancel()
+            self._future = None
+        self._pending = set()
+
+    @callback
+    def _async_fire(self) -> None:
+        self._timer = None
+        self._hass.async_create_task(self._async_run(), eager_start=False)
+
+    async def _async_run(self) -> None:
+        async with self._lock:
+            future, self._future = self._future, None
+            requests, self._pending = self._pending, set()
+            if not future or future.done():
+                return
+            try:
+                result = await self._refresh(requests)
+            except Exception as err:  # noqa: BLE001
+                future.set_exception(err)
+            else:
+                future.set_result(result)
@@ -0,0 +1,148 @@
+"""Retry and circuit breaker for HomeLINK API calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import logging
+import random
+import time
+from typing import Any, TypeVar
+
+from aiohttp import ClientError
+from pyhomelink.exceptions import ApiException, AuthException
+
+from ..const import (
+    RETRY_ATTEMPT_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_BREAKER_RESET,
+    RETRY_BREAKER_THRESHOLD,
+    HomeLINKBreakerState,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
+
+
+class CircuitOpenException(ApiException):
+    """Raised when calls are refused because the API is considered down."""
+
+
+class HomeLINKApiGuard:
+    """Retry with jittered exponential backoff, behind a circuit breaker.
+
+    Each attempt has its own timeout and is retried on API errors, connection
+    errors and timeouts (not on auth errors). The attempts, timeout and backoff
+    are sized to fit within the coordinator's overall timeout for a fetch. Once
+    retries are exhausted the failure counts towards the breaker, which opens
+    after a run of consecutive failures. While open, calls are refused without
+    touching the API until the reset period has passed, then a single trial
+    call is let through to decide whether to close it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        attempts: int = RETRY_ATTEMPTS,
+        attempt_timeout: timedelta = RETRY_ATTEMPT_TIMEOUT,
+        backoff_base: timedelta = RETRY_BACKOFF_BASE,
+        backoff_max: timedelta = RETRY_BACKOFF_MAX,
+        breaker_threshold: int = RETRY_BREAKER_THRESHOLD,
+        breaker_reset: timedelta = RETRY_BREAKER_RESET,
+    ) -> None:
+        """Initialise the guard."""
+        self._attempts = attempts
+        self._attempt_timeout = attempt_timeout.total_seconds()
+        self._backoff_base = backoff_base.total_seconds()
+        self._backoff_max = backoff_max.total_seconds()
+        self._breaker_threshold = breaker_threshold
+        self._breaker_reset = breaker_reset.total_seconds()
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self.state = HomeLINKBreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.retries = 0
+        self.rejected = 0
+
+    async def async_call(self, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Make an API call, retrying and tracking failures for the breaker."""
+        trial = self._check_breaker()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(self._attempt_timeout):
+                        result = await call()
+                except AuthException:
+                    raise
+                except (ApiException, ClientError, TimeoutError) as err:
+                    attempt += 1
+                    if attempt >= self._attempts:
+                        self.record_failure()
+                        if isinstance(err, ClientError):
+                            # Surface as an API error, like those from pyhomelink
+                            raise ApiException(
+                                f"Error connecting to HL API: {err}"
+                            ) from err
+                        raise
+                    delay = random.uniform(
+                        0,
+                        min(self._backoff_max, self._backoff_base * 2 ** (attempt - 1)),
+                    )
+                    _LOGGER.debug(
+                        "Retrying HL API call in %.1fs after error: %s", delay, err
+                    )
+                    self.retries += 1
+                    await asyncio.sleep(delay)
+                else:
+                    self._record_success()
+                    return result
+        finally:
+            if trial:
+                self._trial_running = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retries": self.retries,
+            "rejected": self.rejected,
+        }
+
+    def _check_breaker(self) -> bool:
+        # Return True if this call is the half open trial
+        if self.state == HomeLINKBreakerState.CLOSED:
+            return False
+        if (
+            self.state == HomeLINKBreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self._breaker_reset  # type: ignore[operator]
+        ):
+            self.state = HomeLINKBreakerState.HALF_OPEN
+        if self.state == HomeLINKBreakerState.HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+        self.rejected += 1
+        raise CircuitOpenException("HL API circuit breaker is open")
+
+    def _record_success(self) -> None:
+        if self.state != HomeLINKBreakerState.CLOSED:
+            _LOGGER.info("HL API calls succeeding, circuit breaker closed")
+        self.state = HomeLINKBreakerState.CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call towards opening the breaker."""
+        self.consecutive_failures += 1
+        if (
+            self.state == HomeLINKBreakerState.HALF_OPEN
+            or self.consecutive_failures >= self._breaker_threshold
+        ):
+            if self.state != HomeLINKBreakerState.OPEN:
+                _LOGGER.warning(
+                    "HL API failing, circuit breaker opened for %ss",
+                    self._breaker_reset,
+                )
+            self.state = HomeLINKBreakerState.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,151 @@
+"""Persisted coordinator snapshot for HomeLINK warm starts."""
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from pyhomelink import AbstractAuth
+from pyhomelink.alert import Alert
+from pyhomelink.device import Device
+from pyhomelink.insight import Insight
+from pyhomelink.lookup import LookupEventType
+from pyhomelink.property import Property
+from pyhomelink.reading import PropertyReading
+
+from ..const import (
+    COORD_ALERTS,
+    COORD_DEVICES,
+    COORD_GATEWAY_KEY,
+    COORD_INSIGHTS,
+    COORD_LOOKUP_EVENTTYPE,
+    COORD_PROPERTIES,
+    COORD_PROPERTY,
+    COORD_READINGS,
+    COORD_STALE,
+    DOMAIN,
+    READING_DATE,
+    READING_DEVICES,
+    READING_VALUES,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_VERSION,
+)
+from .utils import raw_data
+
+
+class HomeLINKSnapshot:
+    """Last good coordinator data, stored in a compact form.
+
+    The pyhomelink objects are stored as the raw API data they wrap. Readings
+    are cut down to the latest value for each device, since that is all the
+    sensors show.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise the snapshot."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._save_pending = False
+
+    async def async_load(self, auth: AbstractAuth) -> dict[str, Any] | None:
+        """Load the snapshot, rebuilding coordinator data from it."""
+        if not (snapshot := await self._store.async_load()):
+            return None
+        return {
+            COORD_PROPERTIES: {
+                hl_property_key: _restore(coord_property, auth)
+                for hl_property_key, coord_property in snapshot[
+                    COORD_PROPERTIES
+                ].items()
+            },
+            COORD_LOOKUP_EVENTTYPE: [
+                LookupEventType(eventtype)
+                for eventtype in snapshot[COORD_LOOKUP_EVENTTYPE]
+            ],
+        }
+
+    def async_schedule_save(self, data: Callable[[], dict[str, Any]]) -> None:
+        """Save the coordinator data, delayed so that frequent updates are coalesced.
+
+        A save requested while one is pending is left to that save, which
+        writes the data as it is then. Rescheduling would put the write off
+        for as long as updates keep arriving within the delay.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(lambda: self._compact(data()), SNAPSHOT_SAVE_DELAY)
+
+    def _compact(self, data: dict[str, Any]) -> dict[str, Any]:
+        self._save_pending = False
+        return _compact(data)
+
+    async def async_remove(self) -> None:
+        """Remove the stored snapshot."""
+        await self._store.async_remove()
+
+
+def _compact(data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        COORD_PROPERTIES: {
+            hl_property_key: {
+                COORD_GATEWAY_KEY: coord_property[COORD_GATEWAY_KEY],
+                COORD_PROPERTY: raw_data(coord_property[COORD_PROPERTY]),
+                COORD_DEVICES: [
+                    raw_data(device)
+                    for device in coord_property[COORD_DEVICES].values()
+                ],
+                COORD_ALERTS: [
+                    raw_data(alert) for alert in coord_property[COORD_ALERTS]
+                ],
+                COORD_READINGS: [
+                    _latest_reading(raw_data(reading))
+                    for reading in coord_property[COORD_READINGS]
+                ],
+                COORD_INSIGHTS: [
+                    raw_data(insight) for insight in coord_property[COORD_INSIGHTS]
+                ],
+            }
+            for hl_property_key, coord_property in data[COORD_PROPERTIES].items()
+        },
+        COORD_LOOKUP_EVENTTYPE: [
+            raw_data(eventtype) for eventtype in data[COORD_LOOKUP_EVENTTYPE]
+        ],
+    }
+
+
+def _restore(coord_property: dict[str, Any], auth: AbstractAuth) -> dict[str, Any]:
+    devices = [Device(device, auth) for device in coord_property[COORD_DEVICES]]
+    return {
+        COORD_GATEWAY_KEY: coord_property[COORD_GATEWAY_KEY],
+        COORD_PROPERTY: Property(coord_property[COORD_PROPERTY], auth),
+        COORD_DEVICES: {device.serialnumber: device for device in devices},
+        COORD_ALERTS: [Alert(alert) for alert in coord_property[COORD_ALERTS]],
+        COORD_READINGS: [
+            PropertyReading(reading) for reading in coord_property[COORD_READINGS]
+        ],
+        COORD_INSIGHTS: [
+            Insight(insight) for insight in coord_property[COORD_INSIGHTS]
+        ],
+        # Snapshot data is stale until refreshed from the API
+        COORD_STALE: {COORD_ALERTS, COORD_READINGS, COORD_INSIGHTS},
+    }
+
+
+def _latest_reading(reading: dict[str, Any]) -> dict[str, Any]:
+    return {
+        **reading,
+        READING_DEVICES: [
+            {
+                **device,
+                READING_VALUES: [
+                    max(device[READING_VALUES], key=lambda value: value[READING_DATE])
+                ]
+                if device[READING_VALUES]
+                else [],
+            }
+            for device in reading[READING_DEVICES]
+        ],
+    }
@@ -0,0 +1,251 @@
+"""Import of HomeLINK energy readings into long-term statistics."""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from pyhomelink.exceptions import ApiException
+from pyhomelink.property import Property
+from pyhomelink.reading import PropertyReading
+
+from ..const import (
+    DOMAIN,
+    READING_DATE,
+    READING_DEVICES,
+    READING_SERIALNUMBER,
+    READING_TYPE,
+    READING_VALUE,
+    READING_VALUES,
+    READINGS_RETENTION_DAYS,
+    READINGS_SENSOR_ELECTRIC,
+    READINGS_SENSOR_ELECTRIC_TARIFF,
+    READINGS_SENSOR_GAS,
+    READINGS_SENSOR_GAS_TARIFF,
+    SENSOR_TRANSLATION_KEY,
+    STATISTICS_IMPORT_CHUNK,
+)
+from .utils import raw_data
+
+_LOGGER = logging.getLogger(__name__)
+
+_ENERGY_TYPES = (READINGS_SENSOR_ELECTRIC, READINGS_SENSOR_GAS)
+_TARIFF_TYPES = (READINGS_SENSOR_ELECTRIC_TARIFF, READINGS_SENSOR_GAS_TARIFF)
+
+# Statistic id to metadata and the values in each hour, keyed by reading date
+StatisticSeries = dict[str, tuple[StatisticMetaData, dict[datetime, dict[str, float]]]]
+
+
+class HomeLINKStatistics:
+    """Hourly energy and tariff statistics built from the readings.
+
+    Energy readings are half hourly consumption, they are summed into complete
+    hours and imported with a running total so the energy dashboard can use
+    them. Tariffs are imported as a mean. Only hours after the last one
+    imported are added, so re-imports do not duplicate. The first time a
+    property is seen with no statistics, the days the API still holds are
+    retrieved and imported too, with a fetch that does not share the polling
+    circuit breaker. Rows are added in chunks so the recorder is
+    not flooded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        fetch: Callable[[Property, date], Awaitable[list[PropertyReading]]],
+    ) -> None:
+        """Initialise the statistics importer."""
+        self._hass = hass
+        self._entry = entry
+        self._fetch = fetch
+        self._lock = asyncio.Lock()
+        self._property_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._last: dict[str, tuple[float, float]] = {}
+        self._backfilled: set[str] = set()
+
+    @callback
+    def async_schedule_import(
+        self, hl_property: Property, readings: list[PropertyReading]
+    ) -> None:
+        """Import the readings in the background, if the recorder is running."""
+        if "recorder" not in self._hass.config.components:
+            return
+        self._entry.async_create_background_task(
+            self._hass,
+            self.async_import(hl_property, readings),
+            f"{DOMAIN}_statistics_import",
+        )
+
+    async def async_import(
+        self, hl_property: Property, readings: list[PropertyReading]
+    ) -> None:
+        """Import the readings for a property."""
+        series = _build_series(hl_property.reference, readings)
+        if not series:
+            return
+        # Imports for a property are serialised so that its running totals
+        # continue correctly, and a backfill is added before any newer hours.
+        # Other properties are not held up while a backfill is retrieved.
+        async with self._property_locks[hl_property.reference]:
+            async with self._lock:
+                for statistic_id in series:
+                    await self._async_load_last(statistic_id)
+            if hl_property.reference not in self._backfilled:
+                self._backfilled.add(hl_property.reference)
+                if any(statistic_id not in self._last for statistic_id in series):
+                    await self._async_backfill(hl_property, series)
+            async with self._lock:
+                for statistic_id, (metadata, hours) in series.items():
+                    self._add_statistics(statistic_id, metadata, hours)
+
+    async def _async_load_last(self, statistic_id: str) -> None:
+        if statistic_id in self._last:
+            return
+        last_stats = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, statistic_id, True, {"sum"}
+        )
+        if last_stats.get(statistic_id):
+            last_stat = last_stats[statistic_id][0]
+            self._last[statistic_id] = (last_stat["start"], last_stat.get("sum") or 0)
+
+    async def _async_backfill(
+        self,
+        hl_property: Property,
+        series: StatisticSeries,
+    ) -> None:
+        today = dt_util.now().date()
+        readings = []
+        for days_ago in range(READINGS_RETENTION_DAYS, 0, -1):
+            try:
+                readings.extend(
+                    await self._fetch(hl_property, today - timedelta(days=days_ago))
+                )
+            except ApiException as err:
+                # Skip the day, rather than losing the days after it
+                _LOGGER.debug(
+                    "Readings backfill for %s skipped %s: %s",
+                    hl_property.reference,
+                    today - timedelta(days=days_ago),
+                    err,
+                )
+        backfill = _build_series(hl_property.reference, readings)
+        for statistic_id, (metadata, hours) in backfill.items():
+            if statistic_id in self._last:
+                continue
+            if statistic_id not in series:
+                series[statistic_id] = (metadata, hours)
+                continue
+            for hour, values in hours.items():
+                series[statistic_id][1][hour].update(values)
+
+    def _add_statistics(
+        self,
+        statistic_id: str,
+        metadata: StatisticMetaData,
+        hours: dict[datetime, dict[str, float]],
+    ) -> None:
+        last_start, total = self._last.get(statistic_id, (0.0, 0.0))
+        newest = max(hours)
+        statistics: list[StatisticData] = []
+        for hour in sorted(hours):
+            values = list(hours[hour].values())
+            if hour.timestamp() <= last_start:
+                continue
+            if metadata["has_sum"]:
+                # An hour is complete once both half hours are in, or a later
+                # hour has been published
+                if len(values) < 2 and hour >= newest:
+                    break
+                total += sum(values)
+                statistics.append(
+                    StatisticData(start=hour, state=sum(values), sum=total)
+                )
+            else:
+                statistics.append(
+                    StatisticData(
+                        start=hour,
+                        mean=sum(values) / len(values),
+                        min=min(values),
+                        max=max(values),
+                    )
+                )
+        if not statistics:
+            return
+        for index in range(0, len(statistics), STATISTICS_IMPORT_CHUNK):
+            async_add_external_statistics(
+                self._hass,
+                metadata,
+                statistics[index : index + STATISTICS_IMPORT_CHUNK],
+            )
+        self._last[statistic_id] = (statistics[-1]["start"].timestamp(), total)
+
+
+def _build_series(
+    hl_property_key: str, readings: list[PropertyReading]
+) -> StatisticSeries:
+    # Group the energy and tariff values into hours for each device
+    series: StatisticSeries = {}
+    for reading in readings:
+        raw = raw_data(reading)
+        if raw[READING_TYPE] not in _ENERGY_TYPES + _TARIFF_TYPES:
+            continue
+        for device in raw[READING_DEVICES]:
+            if not device[READING_VALUES]:
+                continue
+            metadata = _metadata(
+                hl_property_key, device[READING_SERIALNUMBER], raw[READING_TYPE]
+            )
+            _, hours = series.setdefault(
+                metadata["statistic_id"], (metadata, defaultdict(dict))
+            )
+            # Keyed by reading date, since a day may be retrieved more than once
+            for value in device[READING_VALUES]:
+                if parsed := dt_util.parse_datetime(value[READING_DATE]):
+                    hours[parsed.replace(minute=0, second=0, microsecond=0)][
+                        value[READING_DATE]
+                    ] = value[READING_VALUE]
+    return series
+
+
+def _metadata(
+    hl_property_key: str, serialnumber: str, reading_type: str
+) -> StatisticMetaData:
+    name = f"{hl_property_key} {serialnumber} {SENSOR_TRANSLATION_KEY[reading_type]}"
+    if reading_type in _ENERGY_TYPES:
+        return StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=name,
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{slugify(name)}",
+            unit_class=EnergyConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+    return StatisticMetaData(
+        mean_type=StatisticMeanType.ARITHMETIC,
+        has_sum=False,
+        name=name,
+        source=DOMAIN,
+        statistic_id=f"{DOMAIN}:{slugify(name)}",
+        unit_class=None,
+        unit_of_measurement="GBp/kWh",
+    )
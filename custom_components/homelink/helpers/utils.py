@@ -84,6 +84,11 @@ def include_property(options: MappingProxyType[str, Any], hl_property: str) -> b
     return properties.get(hl_property, True)
 
 
+def raw_data(hl_object: Any) -> Any:
+    """Return the API response data a pyhomelink object wraps."""
+    return hl_object._raw_data  # noqa: SLF001 # pylint: disable=protected-access
+
+
 def raise_property_alarm_event(
     hass: HomeAssistant, event_type: str, topic: str, payload: dict
 ) -> None:
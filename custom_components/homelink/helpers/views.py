@@ -0,0 +1,203 @@
+"""Per property views over the HomeLINK coordinator data."""
+
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from pyhomelink.alert import Alert
+from pyhomelink.device import Device
+from pyhomelink.insight import Insight
+from pyhomelink.reading import PropertyReading
+
+from ..const import (
+    APPLIESTO_ROOM,
+    ALARMTYPE_ALARM,
+    ALARMTYPE_ENVIRONMENT,
+    ATTR_ALERTID,
+    ATTR_CATEGORY,
+    ATTR_DESCRIPTION,
+    ATTR_DEVICE,
+    ATTR_EVENTTYPE,
+    ATTR_RAISEDDATE,
+    ATTR_SEVERITY,
+    ATTR_STATUS,
+    ATTR_TYPE,
+    CATEGORY_INSIGHT,
+    COORD_ALERTS,
+    COORD_ALERTS_VIEW,
+    COORD_DEVICES,
+    COORD_GATEWAY_KEY,
+    COORD_INSIGHTS,
+    COORD_INSIGHTS_VIEW,
+    COORD_READINGS,
+    COORD_READINGS_VIEW,
+    COORD_ROOM_DEVICES,
+    MODELLIST_ENVIRONMENT,
+)
+
+
+class AlertEntry(NamedTuple):
+    """An alert, its position in the alerts list and its entity attributes."""
+
+    position: int
+    alert: Alert
+    attributes: dict[str, Any]
+
+
+class HomeLINKAlertsView:
+    """A property's alerts, grouped for the entities that show them.
+
+    Built once each time the property's alerts are updated, so that each entity
+    picks up its alerts by lookup rather than scanning and rebuilding the
+    attributes for every alert.
+    """
+
+    def __init__(self, hl_property_key: str, alerts: list[Alert]) -> None:
+        """Group the alerts."""
+        self.property_alerts: list[AlertEntry] = []
+        self.alarm_types: dict[str, list[AlertEntry]] = {
+            ALARMTYPE_ALARM: [],
+            ALARMTYPE_ENVIRONMENT: [],
+        }
+        self.devices: dict[str, list[AlertEntry]] = {}
+        self.locations: dict[str, list[AlertEntry]] = {}
+        for position, alert in enumerate(alerts):
+            entry = AlertEntry(position, alert, _alert_attributes(alert))
+            rel = alert.rel
+            if device := getattr(rel, ATTR_DEVICE, None):
+                self.devices.setdefault(device, []).append(entry)
+                if rel.hl_property == f"property/{hl_property_key}":
+                    self.property_alerts.append(entry)
+            if not alert.serialnumber:
+                self.locations.setdefault(alert.location, []).append(entry)
+            self.alarm_types[_alarm_type(alert)].append(entry)
+
+    def device_alerts(self, device: str, location: str | None) -> list[AlertEntry]:
+        """Return the alerts for a device, in alerts list order.
+
+        Environment devices pass their location, and also pick up the alerts
+        raised against it that have no serial number.
+        """
+        device_alerts = self.devices.get(device, [])
+        if not location or not (location_alerts := self.locations.get(location)):
+            return device_alerts
+        if not device_alerts:
+            return location_alerts
+        entries = {entry.position: entry for entry in device_alerts + location_alerts}
+        return [entries[position] for position in sorted(entries)]
+
+
+class LatestReading(NamedTuple):
+    """The newest value of a reading for a device."""
+
+    value: Any
+    readingdate: datetime
+
+
+class HomeLINKReadingsView:
+    """The newest value of each reading type for each device of a property.
+
+    Keyed by reading type and by the device serial number with the gateway
+    prefix removed, which is the key the reading sensors are created with. A
+    device listed without values maps to None.
+    """
+
+    def __init__(
+        self, readings: list[PropertyReading], gateway_key: str | None
+    ) -> None:
+        """Index the readings."""
+        self.latest: dict[tuple[str, str], LatestReading | None] = {}
+        for reading in readings:
+            for device in reading.devices:
+                self.latest[
+                    (
+                        reading.type,
+                        device.serialnumber.removeprefix(f"{gateway_key}-"),
+                    )
+                ] = max(
+                    (
+                        LatestReading(value.value, value.readingdate)
+                        for value in device.values
+                    ),
+                    key=lambda latest: latest.readingdate,
+                    default=None,
+                )
+
+
+class HomeLINKInsightsView:
+    """A property's insights, keyed by what they apply to, location and type.
+
+    Only room insights are keyed by location, since the others apply to the
+    whole property.
+    """
+
+    def __init__(self, insights: list[Insight]) -> None:
+        """Index the insights."""
+        self.insights: dict[tuple[str, str | None, str], Insight] = {
+            insight_key(insight.appliesto, insight.location, insight.hl_type): insight
+            for insight in insights
+        }
+
+
+def insight_key(
+    appliesto: str, location: str | None, hl_type: str
+) -> tuple[str, str | None, str]:
+    """Return the key of an insight in the insights view."""
+    return (appliesto, location if appliesto == APPLIESTO_ROOM else None, hl_type)
+
+
+def update_views(
+    hl_property_key: str, coord_property: dict[str, Any], tier: str | None = None
+) -> None:
+    """Rebuild the views that depend on one of a property's tiers.
+
+    Devices are passed as the tier when the property's devices change, and
+    with no tier every view is rebuilt.
+    """
+    if tier in (COORD_ALERTS, None):
+        coord_property[COORD_ALERTS_VIEW] = HomeLINKAlertsView(
+            hl_property_key, coord_property[COORD_ALERTS]
+        )
+    # The gateway key comes from the devices
+    if tier in (COORD_READINGS, COORD_DEVICES, None):
+        coord_property[COORD_READINGS_VIEW] = HomeLINKReadingsView(
+            coord_property[COORD_READINGS], coord_property[COORD_GATEWAY_KEY]
+        )
+    if tier in (COORD_INSIGHTS, None):
+        coord_property[COORD_INSIGHTS_VIEW] = HomeLINKInsightsView(
+            coord_property[COORD_INSIGHTS]
+        )
+    if tier in (COORD_DEVICES, None):
+        coord_property[COORD_ROOM_DEVICES] = _room_devices(
+            coord_property[COORD_DEVICES]
+        )
+
+
+def _room_devices(devices: dict[str, Device]) -> dict[str, str]:
+    # Insight 'virtual' rooms are not linked to a device, so map each room to
+    # the first environment device with the room as its location or nickname
+    room_devices: dict[str, str] = {}
+    for device_key, device in devices.items():
+        if device.modeltype in MODELLIST_ENVIRONMENT:
+            room_devices.setdefault(device.location, device_key)
+            room_devices.setdefault(device.locationnickname, device_key)
+    return room_devices
+
+
+def _alarm_type(alert: Alert) -> str:
+    # Insights and alerts from environment devices belong to the environment alarm
+    if alert.category == CATEGORY_INSIGHT or alert.modeltype in MODELLIST_ENVIRONMENT:
+        return ALARMTYPE_ENVIRONMENT
+    return ALARMTYPE_ALARM
+
+
+def _alert_attributes(alert: Alert) -> dict[str, Any]:
+    return {
+        ATTR_ALERTID: alert.alertid,
+        ATTR_STATUS: alert.status,
+        ATTR_EVENTTYPE: alert.eventtype,
+        ATTR_SEVERITY: alert.severity,
+        ATTR_RAISEDDATE: alert.raiseddate,
+        ATTR_CATEGORY: alert.category,
+        ATTR_TYPE: alert.hl_type,
+        ATTR_DESCRIPTION: alert.description,
+    }
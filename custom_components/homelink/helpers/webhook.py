@@ -27,13 +27,14 @@ from ..const import (
     WEBHOOK_STATUSID,
     HomeLINKMessageType,
 )
+from .push import HomeLINKPushChannel
 from .utils import include_property
 
 _LOGGER = logging.getLogger(__name__)
 ALLOWED_METHODS = [METH_POST]
 
 
-class HomeLINKWebhook:
+class HomeLINKWebhook(HomeLINKPushChannel):
     """HomeLINK Webhooks."""
 
     def __init__(self, entry: ConfigEntry) -> None:
@@ -51,11 +52,13 @@ class HomeLINKWebhook:
             self._async_handle_webhook,
             allowed_methods=ALLOWED_METHODS,
         )
+        self._set_connected(hass, True)
         _LOGGER.debug("HomeLINK Webhook registered")
 
     def unregister_webhooks(self, hass: HomeAssistant, webhook_id: Any) -> None:
         """Unregister the required webhooks with Home Assistant."""
         webhook.async_unregister(hass, webhook_id)
+        self._set_connected(hass, False)
         _LOGGER.debug("HomeLINK Webhook unregistered")
 
     async def _async_handle_webhook(
@@ -65,6 +68,7 @@ class HomeLINKWebhook:
         request: aiohttp.web.Request,
     ) -> None:
         """Handle webhook callback."""
+        self._record_message()
         message = await request.json()
         messagetype, actiontype = self._identify_message(message)
 
@@ -47,14 +47,15 @@ from .const import (
     COORD_DEVICES,
     COORD_GATEWAY_KEY,
     COORD_INSIGHTS,
+    COORD_INSIGHTS_VIEW,
     COORD_PROPERTIES,
     COORD_READINGS,
+    COORD_READINGS_VIEW,
+    COORD_ROOM_DEVICES,
     DOMAIN,
-    HOMELINK_ADD_DEVICE,
-    HOMELINK_ADD_PROPERTY,
+    HOMELINK_ADD_TOPOLOGY,
     HOMELINK_MESSAGE_MQTT,
     MODELLIST_ENERGY,
-    MODELLIST_ENVIRONMENT,
     MODELTYPE_SMARTMETERELEC,
     MODELTYPE_SMARTMETERGAS,
     MODELTYPE_SMARTMETERGASELEC,
@@ -68,13 +69,14 @@ from .const import (
     SENSOR_TRANSLATION_KEY,
 )
 from .helpers.config_data import HLConfigEntry
-from .helpers.coordinator import HomeLINKDataCoordinator
+from .helpers.coordinator import AddedDevice, HomeLINKDataCoordinator
 from .helpers.entity import HomeLINKAlarmEntity, HomeLINKDeviceEntity
 from .helpers.utils import (
     build_mqtt_device_key,
     device_device_info,
     raise_reading_event,
 )
+from .helpers.views import insight_key
 
 PARALLEL_UPDATES = 1
 
@@ -121,115 +123,108 @@ async def async_setup_entry(
     # - Device
     # - Insight - the number of these build up over time, but do not then drop off
 
-    @callback
-    def async_add_sensor_property(hl_property) -> None:
-        # Callback since this can be initiated post setup by coordinator
+    def _property_entities(hl_property: str) -> list[SensorEntity]:
+        entities: list[SensorEntity] = []
         for device_key, device in hl_coordinator.data[COORD_PROPERTIES][hl_property][
             COORD_DEVICES
         ].items():
-            async_add_sensor_device(hl_property, device_key, device, None)
+            entities.extend(_device_entities(hl_property, device_key, device))
         if (
             entry.options.get(CONF_INSIGHTS_ENABLE)
             and COORD_INSIGHTS in hl_coordinator.data[COORD_PROPERTIES][hl_property]
         ):
-            for insight in hl_coordinator.data[COORD_PROPERTIES][hl_property][
-                COORD_INSIGHTS
-            ]:
-                _add_sensor_insight(hl_property, insight)
-
-    @callback
-    def async_add_sensor_device(
-        hl_property: str,
-        device_key: str,
-        device: Device,
-        gateway_key: str | None,  # pylint: disable=unused-argument
-    ) -> None:
-        # Callback since this can be initiated post setup by coordinator
+            entities.extend(
+                _insight_entity(hl_property, insight)
+                for insight in hl_coordinator.data[COORD_PROPERTIES][hl_property][
+                    COORD_INSIGHTS
+                ]
+            )
+        return entities
 
+    def _device_entities(
+        hl_property: str, device_key: str, device: Device
+    ) -> list[SensorEntity]:
         # Non-energy devices
         # - Adds replace by date and last tested date sensors
         # - Adds Reading sensors (if it is an environment device)
         # Energy (virtual) devices - Adds gas/electric sensors as needed based on model type
 
+        entities: list[SensorEntity] = []
         if device.modeltype not in MODELLIST_ENERGY:
             sensor_types = SENSOR_TYPES_REPLACE
 
             if isinstance(device.rel, RelEnvironment):
-                for reading, reading_type in READINGS_ENVIRONMENT.items():
-                    if hasattr(device.rel.readings, reading):
-                        _add_sensor_reading(hl_property, reading_type, device_key)
+                entities.extend(
+                    HomeLINKReadingSensor(
+                        entry, hl_coordinator, hl_property, device_key, reading_type
+                    )
+                    for reading, reading_type in READINGS_ENVIRONMENT.items()
+                    if hasattr(device.rel.readings, reading)
+                )
             else:
                 sensor_types += SENSOR_TYPES_TEST
 
-            async_add_entities(
-                [
-                    HomeLINKSensor(hl_coordinator, hl_property, device_key, description)
-                    for description in sensor_types
-                ]
+            entities.extend(
+                HomeLINKSensor(hl_coordinator, hl_property, device_key, description)
+                for description in sensor_types
             )
         else:
+            reading_types = []
             if device.modeltype in [
                 MODELTYPE_SMARTMETERGASELEC,
                 MODELTYPE_SMARTMETERELEC,
             ]:
-                _add_sensor_energy_reading(
-                    hl_property, READINGS_SENSOR_ELECTRIC, device_key
-                )
-                _add_sensor_energy_reading(
-                    hl_property, READINGS_SENSOR_ELECTRIC_TARIFF, device_key
-                )
+                reading_types += [
+                    READINGS_SENSOR_ELECTRIC,
+                    READINGS_SENSOR_ELECTRIC_TARIFF,
+                ]
             if device.modeltype in [
                 MODELTYPE_SMARTMETERGASELEC,
                 MODELTYPE_SMARTMETERGAS,
             ]:
-                _add_sensor_energy_reading(hl_property, READINGS_SENSOR_GAS, device_key)
-                _add_sensor_energy_reading(
-                    hl_property, READINGS_SENSOR_GAS_TARIFF, device_key
-                )
-
-    def _add_sensor_reading(
-        hl_property: str, reading_type: str, device_key: str
-    ) -> None:
-        async_add_entities(
-            [
-                HomeLINKReadingSensor(
-                    entry, hl_coordinator, hl_property, device_key, reading_type
-                )
-            ]
-        )
-
-    def _add_sensor_energy_reading(
-        hl_property: str, reading_type: str, device_key: str
-    ) -> None:
-        async_add_entities(
-            [
+                reading_types += [READINGS_SENSOR_GAS, READINGS_SENSOR_GAS_TARIFF]
+            entities.extend(
                 HomeLINKEnergyReadingSensor(
                     entry, hl_coordinator, hl_property, device_key, reading_type
                 )
-            ]
-        )
+                for reading_type in reading_types
+            )
+        return entities
 
-    def _add_sensor_insight(hl_property: str, insight: Insight) -> None:
+    def _insight_entity(hl_property: str, insight: Insight) -> SensorEntity:
         # If insight relates to a 'virtual' room then create room insight sensor
         # otherwise create a property insight sensor
         if insight.appliesto == APPLIESTO_ROOM:
-            async_add_entities(
-                [HomeLINKRoomInsightSensor(hl_coordinator, hl_property, insight)]
-            )
-        else:
-            async_add_entities(
-                [HomeLINKPropertyInsightSensor(hl_coordinator, hl_property, insight)]
-            )
+            return HomeLINKRoomInsightSensor(hl_coordinator, hl_property, insight)
+        return HomeLINKPropertyInsightSensor(hl_coordinator, hl_property, insight)
 
-    for property_ref in hl_coordinator.data[COORD_PROPERTIES]:
-        async_add_sensor_property(property_ref)
-
-    entry.async_on_unload(
-        async_dispatcher_connect(hass, HOMELINK_ADD_PROPERTY, async_add_sensor_property)
+    @callback
+    def async_add_sensor_topology(
+        hl_properties: list[str], added_devices: list[AddedDevice]
+    ) -> None:
+        # Callback since this can be initiated post setup by coordinator
+        entities = [
+            entity
+            for hl_property in hl_properties
+            for entity in _property_entities(hl_property)
+        ]
+        for added in added_devices:
+            entities.extend(
+                _device_entities(added.hl_property_key, added.device_key, added.device)
+            )
+        async_add_entities(entities)
+
+    # The entities for every property are added as a single batch
+    async_add_entities(
+        [
+            entity
+            for hl_property in hl_coordinator.data[COORD_PROPERTIES]
+            for entity in _property_entities(hl_property)
+        ]
     )
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, HOMELINK_ADD_DEVICE, async_add_sensor_device)
+        async_dispatcher_connect(hass, HOMELINK_ADD_TOPOLOGY, async_add_sensor_topology)
     )
 
 
@@ -281,6 +276,7 @@ class HomeLINKReadingSensor(HomeLINKDeviceEntity, SensorEntity):
     """Reading sensor entity object for HomeLINK sensor."""
 
     _attr_has_entity_name = True
+    _coordinator_tiers = (COORD_READINGS,)
 
     def __init__(
         self,
@@ -344,32 +340,16 @@ class HomeLINKReadingSensor(HomeLINKDeviceEntity, SensorEntity):
     def _update_attributes(self) -> None:
         if not self._is_data_in_coordinator():
             return  # pragma: no cover
-        # Extract the right data from co-ordinator
-        # - Is it the right reading type
-        # - Is it the right device (remove the gateway key if needed)
-        # - Get the latest reading (because they may not be sorted)
-        for reading in self.coordinator.data[COORD_PROPERTIES][self._parent_key][
-            COORD_READINGS
-        ]:
-            if reading.type != self._readingtype:
-                continue
-            for device in reading.devices:
-                if (
-                    device.serialnumber.removeprefix(f"{self._gateway_key}-")
-                    != self._key
-                ):
-                    continue
-
-                for value in device.values:
-                    if (
-                        self._readingdate is None
-                        or value.readingdate > self._readingdate
-                    ):
-                        self._update_values(value)
-                if self.hass:
-                    self.async_write_ha_state()
-
-                break
+        # Look up the latest reading for the reading type and device
+        readings_view = self.coordinator.data[COORD_PROPERTIES][self._parent_key][
+            COORD_READINGS_VIEW
+        ]
+        # The state is written once the update is handled, if it has changed
+        latest = readings_view.latest.get((self._readingtype, self._key))
+        if latest and (
+            self._readingdate is None or latest.readingdate > self._readingdate
+        ):
+            self._update_values(latest)
 
     def _is_data_in_coordinator(self) -> bool:
         return (
@@ -430,6 +410,7 @@ class HomeLINKPropertyInsightSensor(HomeLINKAlarmEntity, SensorEntity):
     """Property Insight sensor entity object for HomeLINK sensor."""
 
     _attr_has_entity_name = True
+    _coordinator_tiers = (COORD_INSIGHTS,)
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfRatio.PERCENTAGE
 
@@ -465,31 +446,23 @@ class HomeLINKPropertyInsightSensor(HomeLINKAlarmEntity, SensorEntity):
         }
 
     def _update_attributes(self) -> None:
-        for insight in self.coordinator.data[COORD_PROPERTIES][self._key][
-            COORD_INSIGHTS
-        ]:
-            if (
-                insight.appliesto == APPLIESTO_PROPERTY
-                and insight.hl_type == self._insight.hl_type
-            ):
-                self._insight = insight
+        if insight := self._get_insight():
+            self._insight = insight
 
     def _is_data_in_coordinator(self) -> bool:
-        return any(
-            (
-                insight.appliesto == APPLIESTO_PROPERTY
-                and insight.hl_type == self._insight.hl_type
-            )
-            for insight in self.coordinator.data[COORD_PROPERTIES][self._key][
-                COORD_INSIGHTS
-            ]
-        )
+        return self._get_insight() is not None
+
+    def _get_insight(self) -> Insight | None:
+        return self.coordinator.data[COORD_PROPERTIES][self._key][
+            COORD_INSIGHTS_VIEW
+        ].insights.get(insight_key(APPLIESTO_PROPERTY, None, self._insight.hl_type))
 
 
 class HomeLINKRoomInsightSensor(HomeLINKDeviceEntity, SensorEntity):
     """Device Insight sensor entity object for HomeLINK sensor."""
 
     _attr_has_entity_name = True
+    _coordinator_tiers = (COORD_INSIGHTS,)
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfRatio.PERCENTAGE
 
@@ -511,19 +484,10 @@ class HomeLINKRoomInsightSensor(HomeLINKDeviceEntity, SensorEntity):
         self, coordinator: HomeLINKDataCoordinator, hl_property_key: str, location: str
     ):
         # An insight 'virtual' location does not have a hard linked environment device,
-        # so we have to go figure it out by looking for the locations on the available
-        # environment type devices
-        return next(
-            (
-                device_key
-                for device_key, device in coordinator.data[COORD_PROPERTIES][
-                    hl_property_key
-                ][COORD_DEVICES].items()
-                if location in [device.location, device.locationnickname]
-                and device.modeltype in MODELLIST_ENVIRONMENT
-            ),
-            None,
-        )
+        # so it is mapped to the environment device with the location
+        return coordinator.data[COORD_PROPERTIES][hl_property_key][
+            COORD_ROOM_DEVICES
+        ].get(location)
 
     @property
     def name(self) -> Any:
@@ -546,24 +510,15 @@ class HomeLINKRoomInsightSensor(HomeLINKDeviceEntity, SensorEntity):
         }
 
     def _update_attributes(self) -> None:
-        for insight in self.coordinator.data[COORD_PROPERTIES][self._parent_key][
-            COORD_INSIGHTS
-        ]:
-            if (
-                insight.appliesto == APPLIESTO_ROOM
-                and insight.location == self._insight.location
-                and insight.hl_type == self._insight.hl_type
-            ):
-                self._insight = insight
+        if insight := self._get_insight():
+            self._insight = insight
 
     def _is_data_in_coordinator(self) -> bool:
-        return any(
-            (
-                insight.appliesto == APPLIESTO_ROOM
-                and insight.location == self._insight.location
-                and insight.hl_type == self._insight.hl_type
-            )
-            for insight in self.coordinator.data[COORD_PROPERTIES][self._parent_key][
-                COORD_INSIGHTS
-            ]
+        return self._get_insight() is not None
+
+    def _get_insight(self) -> Insight | None:
+        return self.coordinator.data[COORD_PROPERTIES][self._parent_key][
+            COORD_INSIGHTS_VIEW
+        ].insights.get(
+            insight_key(APPLIESTO_ROOM, self._insight.location, self._insight.hl_type)
         )
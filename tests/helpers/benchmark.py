@@ -0,0 +1,254 @@
+"""Synthetic portfolio and latency injecting auth for HomeLINK benchmarks."""
+
+import asyncio
+from datetime import date
+from typing import Any
+
+from pyhomelink import AbstractAuth
+
+GATEWAY_SERIAL = "GW{property_index:05d}"
+ENVSENSOR_SERIAL = "ENV{property_index:05d}{device_index:03d}"
+PROPERTY_REFERENCE = "BENCH_Property_{property_index:05d}"
+
+
+class MockResponse:
+    """Minimal aiohttp style response."""
+
+    def __init__(self, url: str, payload: Any) -> None:
+        """Initialise MockResponse."""
+        self.url = url
+        self.status = 200 if payload is not None else 404
+        self._payload = payload
+
+    async def json(self) -> Any:
+        """Return the payload."""
+        return self._payload
+
+
+class LatencyAuth(AbstractAuth):
+    """Auth that serves canned payloads after an injected latency."""
+
+    def __init__(self, responses: dict[str, Any], latency: float = 0.0) -> None:
+        """Initialise LatencyAuth."""
+        super().__init__(None)
+        self.responses = responses
+        self.latency = latency
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def async_get_access_token(self) -> str:
+        """Return a dummy token."""
+        return "token"
+
+    async def request(self, method: str, url_suffix: str, **kwargs) -> MockResponse:
+        """Serve the canned payload for the url."""
+        self.calls.append(url_suffix)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return MockResponse(url_suffix, self.responses.get(url_suffix))
+
+
+def _property(property_index: int) -> dict[str, Any]:
+    reference = PROPERTY_REFERENCE.format(property_index=property_index)
+    return {
+        "reference": reference,
+        "createdAt": "2023-09-05T14:46:28.914Z",
+        "updatedAt": "2023-11-16T15:52:09.183Z",
+        "postcode": "PostCode",
+        "latitude": 60.01953704,
+        "longitude": 1.36647542,
+        "address": f"{reference} Town City County PostCode GB",
+        "tags": [],
+        "_rel": {
+            "_self": f"property/{reference}",
+            "devices": f"property/{reference}/devices",
+            "alerts": f"property/{reference}/alerts",
+            "readings": f"property/{reference}/readings",
+            "insights": f"property/{reference}/insights",
+        },
+    }
+
+
+def _device(
+    property_index: int, serial: str, modeltype: str, location: str
+) -> dict[str, Any]:
+    reference = PROPERTY_REFERENCE.format(property_index=property_index)
+    rel = {
+        "_self": f"device/{serial}",
+        "property": f"property/{reference}",
+        "alerts": f"device/{serial}/alerts",
+    }
+    if modeltype == "ENVSENSOR":
+        rel["readings"] = {
+            "temperatureReadings": f"device/{serial}/readings/environment-temperature-indoor",
+            "humidityReadings": f"device/{serial}/readings/environment-humidity-indoor",
+        }
+    return {
+        "serialNumber": serial,
+        "model": "Ei1025" if modeltype == "ENVSENSOR" else "Ei1000G",
+        "modelType": modeltype,
+        "location": location,
+        "locationNickname": None,
+        "manufacturer": "Ei",
+        "installationDate": "2023-11-16T15:48:30.627Z",
+        "installedBy": "Bench User",
+        "replaceDate": "2033-08-15T00:00:00.000Z",
+        "createdAt": "2023-11-16T15:48:32.442Z",
+        "updatedAt": "2023-11-16T15:48:32.442Z",
+        "metadata": {
+            "signalStrength": -54,
+            "lastSeenDate": "2024-09-07T09:24:19.471Z",
+            "connectivityType": "EIRF868",
+        },
+        "status": {
+            "operationalStatus": "GOOD",
+            "lastTestedDate": None,
+            "dataCollectionStatus": "ACTIVE",
+        },
+        "_rel": rel,
+    }
+
+
+def _insight(property_index: int, location: str) -> dict[str, Any]:
+    reference = PROPERTY_REFERENCE.format(property_index=property_index)
+    insight_id = f"{reference}-{location}-MOULD"
+    return {
+        "id": insight_id,
+        "type": "MOULD",
+        "riskLevel": "LOW",
+        "location": location,
+        "calculatedAt": "2024-09-08T23:00:00.000Z",
+        "value": 10.5,
+        "appliesTo": "ROOM",
+        "propertyReference": reference,
+        "_rel": {
+            "_self": f"insight/{insight_id}",
+            "property": f"property/{reference}",
+        },
+    }
+
+
+def _alert(property_index: int, serial: str, location: str, alert_index: int):
+    reference = PROPERTY_REFERENCE.format(property_index=property_index)
+    alert_id = f"{reference}-{alert_index:04d}"
+    return {
+        "id": alert_id,
+        "serialNumber": serial,
+        "description": f"{serial} in location {location}: High humidity",
+        "eventType": "ENVIRONMENT_HUMIDITY_HIGH",
+        "propertyReference": reference,
+        "model": "Ei1025",
+        "modelType": "ENVSENSOR",
+        "location": location,
+        "locationNickname": None,
+        "insightId": None,
+        "raisedDate": "2023-10-13T17:08:52.000Z",
+        "severity": "MEDIUM",
+        "category": "ENVIRONMENT",
+        "type": "DEVICE",
+        "status": "ACTIVE",
+        "_rel": {
+            "property": f"property/{reference}",
+            "_self": f"alert/{alert_id}",
+            "device": f"device/{serial}",
+        },
+    }
+
+
+def _readings(
+    property_index: int, serials: list[str], hours: int
+) -> list[dict[str, Any]]:
+    reference = PROPERTY_REFERENCE.format(property_index=property_index)
+    gateway = GATEWAY_SERIAL.format(property_index=property_index)
+    day = date.today().isoformat()
+    return [
+        {
+            "unit": "n/a",
+            "type": reading_type,
+            "dataAvailability": "Only the last 30days of readings are available",
+            "devices": [
+                {
+                    "count": hours,
+                    "serialNumber": f"{gateway}-{serial}",
+                    "_rel": {
+                        "property": f"property/{reference}",
+                        "device": f"device/{gateway}-{serial}",
+                    },
+                    "values": [
+                        {
+                            "value": 20 + hour / 10,
+                            "readingDate": f"{day}T{hour:02d}:00:00.000Z",
+                        }
+                        for hour in range(hours)
+                    ],
+                }
+                for serial in serials
+            ],
+        }
+        for reading_type in (
+            "environment-temperature-indoor",
+            "environment-humidity-indoor",
+        )
+    ]
+
+
+def build_portfolio(
+    properties: int,
+    devices_per_property: int,
+    alerts_per_property: int = 0,
+    readings_hours: int = 1,
+) -> dict[str, Any]:
+    """Build canned API payloads for a synthetic portfolio.
+
+    Each property has a gateway plus environment sensors in their own rooms,
+    one room insight per sensor, and alerts spread across the sensors.
+    """
+    responses: dict[str, Any] = {}
+    all_properties = []
+    all_devices = []
+    all_insights = []
+    for property_index in range(properties):
+        hl_property = _property(property_index)
+        reference = hl_property["reference"]
+        all_properties.append(hl_property)
+        all_devices.append(
+            _device(
+                property_index,
+                GATEWAY_SERIAL.format(property_index=property_index),
+                "GATEWAY",
+                "KITCHEN",
+            )
+        )
+        serials = []
+        for device_index in range(devices_per_property - 1):
+            serial = ENVSENSOR_SERIAL.format(
+                property_index=property_index, device_index=device_index
+            )
+            location = f"ROOM{device_index:03d}"
+            serials.append(serial)
+            all_devices.append(_device(property_index, serial, "ENVSENSOR", location))
+            all_insights.append(_insight(property_index, location))
+        responses[f"property/{reference}/alerts"] = {
+            "results": [
+                _alert(
+                    property_index,
+                    serials[alert_index % len(serials)],
+                    f"ROOM{alert_index % len(serials):03d}",
+                    alert_index,
+                )
+                for alert_index in range(alerts_per_property if serials else 0)
+            ]
+        }
+        responses[f"property/{reference}/readings?date={date.today()}"] = _readings(
+            property_index, serials, readings_hours
+        )
+    responses["property"] = {"results": all_properties}
+    responses["device"] = {"results": all_devices}
+    responses["insight"] = {"results": all_insights}
+    return responses
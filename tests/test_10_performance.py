@@ -0,0 +1,261 @@
+# pylint: disable=protected-access
+"""Performance benchmarks."""
+
+from datetime import date
+import json
+from unittest.mock import Mock, patch
+
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+
+from custom_components.homelink import binary_sensor, sensor
+from custom_components.homelink.const import (
+    COORD_DEVICES,
+    COORD_INSIGHTS,
+    COORD_PROPERTIES,
+    DOMAIN,
+    HOMELINK_ADD_TOPOLOGY,
+    MODELLIST_ENVIRONMENT,
+)
+from custom_components.homelink.helpers.config_data import HLData
+from custom_components.homelink.helpers.coordinator import HomeLINKDataCoordinator
+from custom_components.homelink.helpers.readings import HomeLINKReadingsTracker
+from custom_components.homelink.helpers.views import (
+    HomeLINKAlertsView,
+    _alert_attributes,
+)
+from pyhomelink import HomeLINKApi
+from pyhomelink.alert import Alert
+from pyhomelink.device import Device
+from pyhomelink.reading import PropertyReading
+
+from .conftest import HomelinkMockConfigEntry
+from .helpers.benchmark import PROPERTY_REFERENCE, LatencyAuth, build_portfolio
+
+LATENCY = 0.05
+
+
+async def test_refresh_latency(
+    hass: HomeAssistant,
+    insight_config_entry: HomelinkMockConfigEntry,
+):
+    """Test top level fetches are issued together."""
+    insight_config_entry.add_to_hass(hass)
+    auth = LatencyAuth(build_portfolio(1, 3), latency=LATENCY)
+    coordinator = HomeLINKDataCoordinator(hass, HomeLINKApi(auth), insight_config_entry)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    # properties, devices, insights, readings and alerts
+    assert len(auth.calls) == 5
+    assert set(auth.calls[:2]) == {"property", "device"}
+    # Sequential calls would have one in flight at a time; properties and devices
+    # go together and then the new property's alerts, readings and insights
+    assert auth.max_in_flight == 3
+
+
+async def test_property_join_scaling(
+    hass: HomeAssistant,
+    insight_config_entry: HomelinkMockConfigEntry,
+):
+    """Test the property join scales linearly up to 1k properties, 10k devices."""
+    insight_config_entry.add_to_hass(hass)
+    device_rel = Device.rel.fget
+    rel_lookups = {}
+    for properties in (100, 1000):
+        auth = LatencyAuth(build_portfolio(properties, 10))
+        coordinator = HomeLINKDataCoordinator(
+            hass, HomeLINKApi(auth), insight_config_entry
+        )
+        lookups = Mock(side_effect=device_rel)
+        with patch.object(Device, "rel", property(lookups)):
+            coord_properties = await coordinator._async_get_core_data()  # noqa: SLF001
+        rel_lookups[properties] = lookups.call_count
+
+        assert len(coord_properties) == properties
+        assert sum(len(data[COORD_DEVICES]) for data in coord_properties.values()) == (
+            properties * 10
+        )
+        assert all(len(data[COORD_INSIGHTS]) == 9 for data in coord_properties.values())
+
+    # Ten times the portfolio is 10x the device lookups; a nested scan of every
+    # device for each property would be 100x
+    assert rel_lookups[1000] == rel_lookups[100] * 10
+
+
+def _parse_readings(readings: list[PropertyReading]) -> int:
+    # What the reading sensors do: parse every value to find the latest
+    parsed = 0
+    for reading in readings:
+        for device in reading.devices:
+            for value in device.values:
+                assert value.readingdate
+                parsed += 1
+    return parsed
+
+
+async def test_readings_at_2300():
+    """Test readings are processed incrementally late in the day."""
+    devices = 20
+    responses = build_portfolio(1, devices + 1, readings_hours=23)
+    url = f"property/{PROPERTY_REFERENCE.format(property_index=0)}/readings?date={date.today()}"
+    payload = [PropertyReading(reading) for reading in responses[url]]
+
+    full_values = _parse_readings(payload)
+
+    today = date.today()
+    tracker = HomeLINKReadingsTracker()
+    tracker.update("PROPERTY", payload, [today], today)
+    latest = tracker.update("PROPERTY", payload, [today], today)
+    latest_values = _parse_readings(latest)
+
+    # Two reading types with 23 hourly values, reduced to the newest value, so
+    # the sensors parse 23x fewer values
+    assert full_values == devices * 2 * 23
+    assert latest_values == devices * 2
+    payload_size = len(json.dumps(responses[url]))
+    latest_size = len(json.dumps([reading._raw_data for reading in latest]))  # noqa: SLF001
+    assert latest_size < payload_size / 5
+
+
+async def test_identical_polls(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test identical polls do not write entity state or fingerprint the data."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    await coordinator.async_refresh_live()
+
+    with (
+        patch.object(Entity, "async_write_ha_state", autospec=True) as write_state,
+        patch(
+            "custom_components.homelink.helpers.coordinator.json.dumps",
+            wraps=json.dumps,
+        ) as serialise,
+    ):
+        for _ in range(100):
+            await coordinator.async_refresh_live()
+        await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert write_state.call_count == 0
+    # Unchanged responses are recognised without serialising them again
+    assert serialise.call_count == 0
+
+
+def _scan_alerts(alerts: list[Alert], device: Device) -> list[Alert]:
+    # What the device binary sensors did: filter every alert for each device
+    return [
+        alert
+        for alert in alerts
+        if (hasattr(alert.rel, "device") and device.rel.self == alert.rel.device)
+        or (
+            alert.location == device.location
+            and device.modeltype in MODELLIST_ENVIRONMENT
+            and not alert.serialnumber
+        )
+    ]
+
+
+async def test_device_alerts_lookup():
+    """Test device alerts are looked up rather than scanned."""
+    responses = build_portfolio(1, 50, alerts_per_property=200)
+    reference = PROPERTY_REFERENCE.format(property_index=0)
+    alerts = [
+        Alert(alert) for alert in responses[f"property/{reference}/alerts"]["results"]
+    ]
+    devices = [Device(device, None) for device in responses["device"]["results"]]
+
+    alert_rel = Alert.rel.fget
+
+    # Each device scanned the alerts for its attributes and again for its status
+    scan_lookups = Mock(side_effect=alert_rel)
+    with patch.object(Alert, "rel", property(scan_lookups)):
+        scanned = []
+        for device in devices:
+            scanned.append(
+                [_alert_attributes(alert) for alert in _scan_alerts(alerts, device)]
+            )
+            assert bool(_scan_alerts(alerts, device)) == bool(scanned[-1])
+
+    view_lookups = Mock(side_effect=alert_rel)
+    with patch.object(Alert, "rel", property(view_lookups)):
+        alerts_view = HomeLINKAlertsView(reference, alerts)
+        looked_up = [
+            [
+                entry.attributes
+                for entry in alerts_view.device_alerts(
+                    device.rel.self,
+                    device.location
+                    if device.modeltype in MODELLIST_ENVIRONMENT
+                    else None,
+                )
+            ]
+            for device in devices
+        ]
+
+    assert looked_up == scanned
+    assert sum(len(device_alerts) for device_alerts in looked_up) == 200
+    # The view is built in one pass over the alerts, rather than two scans per
+    # device that each look at an alert's links twice
+    assert scan_lookups.call_count == len(devices) * len(alerts) * 4
+    assert view_lookups.call_count == len(alerts)
+
+
+async def test_platform_setup_batched(
+    hass: HomeAssistant,
+    insight_config_entry: HomelinkMockConfigEntry,
+):
+    """Test each platform adds the entities for 500 properties in one batch."""
+    insight_config_entry.add_to_hass(hass)
+    auth = LatencyAuth(build_portfolio(500, 3))
+    coordinator = HomeLINKDataCoordinator(hass, HomeLINKApi(auth), insight_config_entry)
+    await coordinator.async_refresh()
+    insight_config_entry.runtime_data = HLData(
+        coordinator, insight_config_entry.options, None, None
+    )
+    # Two properties are held back, to be added later as new topology
+    coord_properties = coordinator.data[COORD_PROPERTIES]
+    added = {
+        hl_property_key: coord_properties.pop(hl_property_key)
+        for hl_property_key in list(coord_properties)[:2]
+    }
+
+    platforms = {}
+    for platform_module, domain in (
+        (binary_sensor, "binary_sensor"),
+        (sensor, "sensor"),
+    ):
+        platform = MockEntityPlatform(hass, domain=domain, platform_name=DOMAIN)
+        platform.config_entry = insight_config_entry
+        add_entities = Mock(wraps=platform._async_schedule_add_entities_for_entry)  # noqa: SLF001
+        await platform_module.async_setup_entry(
+            hass, insight_config_entry, add_entities
+        )
+        await hass.async_block_till_done()
+
+        # One call with every entity, rather than one per property or entity
+        assert add_entities.call_count == 1
+        # Entities disabled by default are registered but have no state
+        assert all(entity.registry_entry for entity in add_entities.call_args.args[0])
+        platforms[domain] = add_entities
+
+    coord_properties.update(added)
+    async_dispatcher_send(hass, HOMELINK_ADD_TOPOLOGY, list(added), [])
+    await hass.async_block_till_done()
+
+    for add_entities in platforms.values():
+        # The new properties' entities are added together in one more call
+        assert add_entities.call_count == 2
+        setup_batch, topology_batch = (
+            call.args[0] for call in add_entities.call_args_list
+        )
+        assert len(topology_batch) * 498 == len(setup_batch) * 2
+        assert {entity.unique_id for entity in topology_batch}.isdisjoint(
+            entity.unique_id for entity in setup_batch
+        )
@@ -0,0 +1,154 @@
+"""Test readings statistics."""
+
+import asyncio
+from datetime import UTC, date, datetime
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from pytest_homeassistant_custom_component.typing import RecorderInstanceGenerator
+
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+
+from custom_components.homelink.helpers.statistics import HomeLINKStatistics
+from pyhomelink.exceptions import ApiException
+from pyhomelink.reading import PropertyReading
+
+from .conftest import HomelinkMockConfigEntry
+from .helpers.utils import load_json
+
+ELECTRICITY = "homelink:dummy_user_my_house_299991234567_electricity"
+ELECTRICITY_TARIFF = "homelink:dummy_user_my_house_299991234567_electricity_tariff"
+GAS = "homelink:dummy_user_my_house_299991234567_gas"
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def test_readings_statistics(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test energy readings are imported as hourly statistics."""
+    readings = [
+        PropertyReading(reading)
+        for reading in json.loads(load_json("base/readings.json"))
+    ]
+    fetch = AsyncMock(return_value=[])
+    hl_statistics = HomeLINKStatistics(hass, base_config_entry, fetch)
+    hl_property = Mock(reference="DUMMY_USER_My_House")
+
+    await hl_statistics.async_import(hl_property, readings)
+    await async_wait_recording_done(hass)
+    # No statistics yet, so the days the API still holds are backfilled once
+    assert fetch.await_count == 30
+
+    # Importing the same readings again adds nothing
+    await hl_statistics.async_import(hl_property, readings)
+    await async_wait_recording_done(hass)
+    assert fetch.await_count == 30
+
+    stats = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime(2024, 10, 29, tzinfo=UTC),
+        None,
+        {ELECTRICITY, ELECTRICITY_TARIFF, GAS},
+        "hour",
+        None,
+        {"sum", "mean"},
+    )
+    # The 05:00 hour only has one half hour, so is not imported yet
+    assert len(stats[ELECTRICITY]) == 5
+    assert (
+        stats[ELECTRICITY][0]["start"] == datetime(2024, 10, 29, tzinfo=UTC).timestamp()
+    )
+    assert stats[ELECTRICITY][-1]["sum"] == pytest.approx(1.076)
+    # A missing half hour before the latest hour does not hold the import back
+    assert len(stats[GAS]) == 5
+    assert stats[GAS][-1]["sum"] == pytest.approx(0.592916666)
+    assert [stat["mean"] for stat in stats[ELECTRICITY_TARIFF]] == [
+        pytest.approx(22.49)
+    ]
+
+
+async def test_readings_statistics_backfill(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test the running total continues on from backfilled days."""
+    readings = [
+        PropertyReading(reading)
+        for reading in json.loads(load_json("base/readings.json"))
+        if reading["type"] == "electricity-power-hour"
+    ]
+    previous_day = json.loads(load_json("base/readings.json"))[0]
+    for value in previous_day["devices"][0]["values"]:
+        value["readingDate"] = value["readingDate"].replace("10-29", "10-28")
+    # The oldest day fails, which does not lose the newer days
+    fetch = AsyncMock(
+        side_effect=[ApiException(), *[[]] * 28, [PropertyReading(previous_day)]]
+    )
+    hl_statistics = HomeLINKStatistics(hass, base_config_entry, fetch)
+
+    await hl_statistics.async_import(Mock(reference="DUMMY_USER_My_House"), readings)
+    await async_wait_recording_done(hass)
+
+    stats = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime(2024, 10, 28, tzinfo=UTC),
+        None,
+        {ELECTRICITY},
+        "hour",
+        None,
+        {"sum"},
+    )
+    # The previous day's 05:00 hour is complete, since later hours exist
+    assert len(stats[ELECTRICITY]) == 11
+    assert stats[ELECTRICITY][-1]["sum"] == pytest.approx(1.076 * 2 + 0.105)
+
+
+async def test_readings_statistics_backfill_concurrent(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test a backfill does not hold up the imports for other properties."""
+    readings = [
+        PropertyReading(reading)
+        for reading in json.loads(load_json("base/readings.json"))
+    ]
+    backfill_started = asyncio.Event()
+    release_backfill = asyncio.Event()
+
+    async def _fetch(hl_property: Mock, day: date) -> list[PropertyReading]:
+        if hl_property.reference == "DUMMY_USER_My_House":
+            backfill_started.set()
+            await release_backfill.wait()
+        return []
+
+    hl_statistics = HomeLINKStatistics(hass, base_config_entry, _fetch)
+    backfill = hass.async_create_task(
+        hl_statistics.async_import(Mock(reference="DUMMY_USER_My_House"), readings)
+    )
+    await backfill_started.wait()
+
+    async with asyncio.timeout(5):
+        await hl_statistics.async_import(Mock(reference="Other_House"), readings)
+    assert not backfill.done()
+
+    release_backfill.set()
+    await backfill
+    await async_wait_recording_done(hass)
@@ -1,15 +1,25 @@
 """Test setup process."""
 
 from copy import deepcopy
+from datetime import date, timedelta
+from typing import Any
 from unittest.mock import Mock, patch
 
 from aiohttp import ClientSession
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 from pyhomelink.exceptions import AuthException
 from custom_components.homelink import async_setup_entry
-from custom_components.homelink.const import CONF_PROPERTIES
+from custom_components.homelink.const import (
+    CONF_PROPERTIES,
+    COORD_ALERTS,
+    COORD_DEVICES,
+    COORD_PROPERTIES,
+    COORD_STALE,
+)
 from custom_components.homelink.helpers import api
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.core_config import async_process_ha_core_config
 from homeassistant.exceptions import (
@@ -24,14 +34,21 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+
 # from homeassistant.helpers.config_entry_oauth2_flow import (
 #     ImplementationUnavailableError,
 # )
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .conftest import HomelinkMockConfigEntry, standard_mocks
 from .helpers.const import DOMAIN, EXTERNAL_URL, REFRESH_CONFIG_ENTRY, TITLE, TOKEN_URL
-from .helpers.utils import add_property_mocks, check_entity_state, mock_token_call
+from .helpers.utils import (
+    add_property_mocks,
+    check_entity_state,
+    create_mock,
+    mock_token_call,
+)
 
 
 # async def test_setup_implementation_error(
@@ -236,6 +253,7 @@ async def test_ignore_property(
             },
         },
     )
+    await hass.async_block_till_done()
     coordinator = insight_config_entry.runtime_data.coordinator
 
     aioclient_mock.clear_requests()
@@ -251,3 +269,118 @@ async def test_ignore_property(
         entity_registry, insight_config_entry.entry_id
     )
     assert len(entities) == 14
+
+
+@pytest.mark.usefixtures("setup_base_integration")
+async def test_warm_start(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+    entity_registry: er.EntityRegistry,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test setup from the stored snapshot, with a live refresh in background."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    snapshot = hass_storage[f"{DOMAIN}.{base_config_entry.entry_id}"]["data"]
+    assert list(snapshot[COORD_PROPERTIES]) == ["DUMMY_USER_My_House"]
+
+    await hass.config_entries.async_unload(base_config_entry.entry_id)
+    await hass.async_block_till_done()
+    with (
+        patch(
+            "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_config_entry_first_refresh",
+        ) as first_refresh,
+        patch(
+            "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_live",
+        ) as refresh_live,
+    ):
+        await hass.config_entries.async_setup(base_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert base_config_entry.state is ConfigEntryState.LOADED
+    assert not first_refresh.called
+    assert refresh_live.called
+    check_entity_state(hass, "binary_sensor.dummy_user_my_house", "off")
+    check_entity_state(hass, "binary_sensor.dummy_user_my_house_alarm", "off")
+    entities = er.async_entries_for_config_entry(
+        entity_registry, base_config_entry.entry_id
+    )
+    assert len(entities) == 30
+
+    coordinator = base_config_entry.runtime_data.coordinator
+    assert coordinator.data[COORD_PROPERTIES]["DUMMY_USER_My_House"][COORD_STALE]
+    # The stored readings are old, so the days since are retrieved
+    for days_ago in range(1, 31):
+        create_mock(
+            aioclient_mock,
+            "/property/DUMMY_USER_My_House/readings"
+            f"?date={date.today() - timedelta(days=days_ago)}",
+            "base/readings.json",
+        )
+    await coordinator.async_refresh_live()
+    assert not coordinator.data[COORD_PROPERTIES]["DUMMY_USER_My_House"][COORD_STALE]
+
+
+@pytest.mark.usefixtures("setup_base_integration")
+async def test_warm_start_live_changes(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+    hass_storage: dict[str, Any],
+):
+    """Test the first live refresh updates entities that differ from the snapshot."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    snapshot = hass_storage[f"{DOMAIN}.{base_config_entry.entry_id}"]["data"]
+    device = snapshot[COORD_PROPERTIES]["DUMMY_USER_My_House"][COORD_DEVICES][0]
+    device["status"]["lastTestedDate"] = "2020-01-01T00:00:00.000Z"
+
+    await hass.config_entries.async_unload(base_config_entry.entry_id)
+    await hass.async_block_till_done()
+    with patch(
+        "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_live",
+    ):
+        await hass.config_entries.async_setup(base_config_entry.entry_id)
+        await hass.async_block_till_done()
+    entity_id = "binary_sensor.dummy_user_my_house_livingroom_firealarm"
+    state = hass.states.get(entity_id)
+    assert state.attributes["status"]["lasttesteddate"].year == 2020
+
+    await base_config_entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.attributes["status"]["lasttesteddate"].year == 2024
+
+
+@pytest.mark.usefixtures("setup_base_integration")
+async def test_snapshot_saved_while_polling(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test tier polls do not put off the snapshot save, or save unchanged data."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    alerts_coordinator = coordinator.tiers[COORD_ALERTS]
+    storage_key = f"{DOMAIN}.{base_config_entry.entry_id}"
+
+    aioclient_mock.clear_requests()
+    create_mock(
+        aioclient_mock, "/property/DUMMY_USER_My_House/alerts", "base/alerts_alarm.json"
+    )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await alerts_coordinator.async_refresh()
+    assert storage_key not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    snapshot = hass_storage[storage_key]["data"]
+    assert len(snapshot[COORD_PROPERTIES]["DUMMY_USER_My_House"][COORD_ALERTS]) == 1
+
+    with patch(
+        "custom_components.homelink.helpers.snapshot.HomeLINKSnapshot.async_schedule_save"
+    ) as schedule_save:
+        await alerts_coordinator.async_refresh()
+    assert alerts_coordinator.last_update_success
+    assert not schedule_save.called
@@ -3,6 +3,15 @@
 import pytest
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.homelink.const import (
+    ALARMTYPE_ENVIRONMENT,
+    COORD_ALERTS,
+    COORD_ALERTS_VIEW,
+    COORD_PROPERTIES,
+)
+from custom_components.homelink.helpers.utils import build_device_identifiers
 
 from .conftest import HomelinkMockConfigEntry
 from .data.state.core_state import ALARM_BAD, ENVIRONMENT_BAD
@@ -60,3 +69,53 @@ async def test_alarm_alert_state(
         "2024-09-06T09:05:16+00:00",
         "2034-06-26",
     )
+
+
+@pytest.mark.parametrize(
+    "setup_base_integration",
+    [{"method_name": "alarm_alert_mocks", "enabled": True}],
+    indirect=True,
+)
+async def test_alerts_view(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test the alerts view is built once per alerts update."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    await coordinator.tiers[COORD_ALERTS].async_refresh()
+    await hass.async_block_till_done()
+    coord_property = coordinator.data[COORD_PROPERTIES]["DUMMY_USER_My_House"]
+    alerts_view = coord_property[COORD_ALERTS_VIEW]
+    assert len(alerts_view.property_alerts) == len(coord_property[COORD_ALERTS])
+    assert not alerts_view.alarm_types[ALARMTYPE_ENVIRONMENT]
+
+    # Unchanged alerts keep the existing view
+    await coordinator.tiers[COORD_ALERTS].async_refresh()
+    await hass.async_block_till_done()
+    assert coord_property[COORD_ALERTS_VIEW] is alerts_view
+
+
+@pytest.mark.parametrize(
+    "setup_base_integration",
+    [{"method_name": "alarm_alert_mocks", "enabled": True}],
+    indirect=True,
+)
+async def test_alarmed_device_renamed(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+    device_registry: dr.DeviceRegistry,
+):
+    """Test alarmed devices are listed by their new name once renamed."""
+    device = device_registry.async_get_device(build_device_identifiers("D8EAF0D0"))
+    device_registry.async_update_device(device.id, name_by_user="Lounge smoke alarm")
+    await hass.async_block_till_done()
+
+    for entity_id in (
+        "binary_sensor.dummy_user_my_house",
+        "binary_sensor.dummy_user_my_house_alarm",
+    ):
+        assert hass.states.get(entity_id).attributes["alarmed_devices"] == [
+            "Lounge smoke alarm"
+        ]
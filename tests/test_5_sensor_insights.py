@@ -2,6 +2,16 @@
 
 from homeassistant.core import HomeAssistant
 
+from custom_components.homelink.const import (
+    APPLIESTO_PROPERTY,
+    APPLIESTO_ROOM,
+    COORD_INSIGHTS,
+    COORD_INSIGHTS_VIEW,
+    COORD_PROPERTIES,
+    COORD_ROOM_DEVICES,
+)
+from custom_components.homelink.helpers.views import insight_key
+
 from .conftest import HomelinkMockConfigEntry
 from .data.state.insight_state import (
     ABANDONMENT,
@@ -57,3 +67,22 @@ async def test_insights_init(
         "20.3674",
         VENTILATION,
     )
+
+
+async def test_insights_view(
+    hass: HomeAssistant,
+    setup_insight_integration: None,
+    insight_config_entry: HomelinkMockConfigEntry,
+):
+    """Test insights are indexed and rooms mapped to environment devices."""
+    coordinator = insight_config_entry.runtime_data.coordinator
+    coord_property = coordinator.data[COORD_PROPERTIES]["DUMMY_USER_My_House"]
+
+    insights = coord_property[COORD_INSIGHTS_VIEW].insights
+    assert len(insights) == len(coord_property[COORD_INSIGHTS])
+    assert insights[insight_key(APPLIESTO_ROOM, "HALLWAY1", "MOULD")].location == (
+        "HALLWAY1"
+    )
+    assert insight_key(APPLIESTO_PROPERTY, "HALLWAY1", "MOULD") in insights
+    # The environment device, not the accessory in the same room
+    assert coord_property[COORD_ROOM_DEVICES]["HALLWAY1"] == "001FD75F"
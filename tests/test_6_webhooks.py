@@ -1,10 +1,28 @@
 """Test setup process."""
 
+import json
 from unittest.mock import patch
 from urllib.parse import urlparse
 
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.util import dt as dt_util
+
+from custom_components.homelink.const import (
+    COORD_ALERTS,
+    RETRIEVAL_INTERVAL_ALERTS,
+    RETRIEVAL_INTERVAL_ALERTS_PUSH,
+)
+
 from .conftest import HomelinkMockConfigEntry, WebhookSetupData
-from .helpers.utils import check_entity_state, load_webhook_json
+from .helpers.const import BASE_API_URL
+from .helpers.utils import (
+    check_entity_state,
+    create_mock,
+    load_json,
+    load_webhook_json,
+)
 
 
 async def test_webhook_property_environment_alert(
@@ -14,7 +32,7 @@ async def test_webhook_property_environment_alert(
     """Test webhook alert receipt and no refresh start."""
 
     with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_refresh",
+        "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_property_alerts",
     ) as async_refresh:
         resp = await webhook_setup.client.post(
             urlparse(webhook_setup.webhook_url).path,
@@ -25,7 +43,7 @@ async def test_webhook_property_environment_alert(
     assert resp.ok
     assert len(webhook_setup.events) == 1
     assert webhook_setup.events[0].event_type == "homelink_alert"
-    assert async_refresh.called
+    async_refresh.assert_called_once_with("DUMMY_USER_My_House")
     resp.close()
 
 
@@ -36,7 +54,7 @@ async def test_webhook_property_fire_alert(
     """Test webhook alert receipt and no refresh start."""
 
     with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_refresh",
+        "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_property_alerts",
     ) as async_refresh:
         resp = await webhook_setup.client.post(
             urlparse(webhook_setup.webhook_url).path,
@@ -47,7 +65,7 @@ async def test_webhook_property_fire_alert(
     assert resp.ok
     assert len(webhook_setup.events) == 1
     assert webhook_setup.events[0].event_type == "homelink_alert"
-    assert async_refresh.called
+    async_refresh.assert_called_once_with("DUMMY_USER_My_House")
     resp.close()
 
 
@@ -58,7 +76,7 @@ async def test_webhook_device_alert(
     """Test webhook alert receipt and refresh start."""
 
     with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_refresh",
+        "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_property_alerts",
     ) as async_refresh:
         resp = await webhook_setup.client.post(
             urlparse(webhook_setup.webhook_url).path,
@@ -69,7 +87,7 @@ async def test_webhook_device_alert(
     assert resp.ok
     assert len(webhook_setup.events) == 1
     assert webhook_setup.events[0].event_type == "homelink_alert"
-    assert async_refresh.called
+    async_refresh.assert_called_once_with("DUMMY_USER_My_House")
     resp.close()
 
 
@@ -139,7 +157,7 @@ async def test_webhook_property_add(
     """Test webhook property receipt and refresh start."""
 
     with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_refresh",
+        "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_topology",
     ) as async_refresh:
         resp = await webhook_setup.client.post(
             urlparse(webhook_setup.webhook_url).path,
@@ -182,7 +200,7 @@ async def test_webhook_device_add(
     """Test webhook device receipt and refresh start."""
 
     with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_refresh",
+        "custom_components.homelink.helpers.coordinator.HomeLINKDataCoordinator.async_refresh_property_devices",
     ) as async_refresh:
         resp = await webhook_setup.client.post(
             urlparse(webhook_setup.webhook_url).path,
@@ -193,7 +211,7 @@ async def test_webhook_device_add(
     assert resp.ok
     assert len(webhook_setup.events) == 1
     assert webhook_setup.events[0].event_type == "homelink_device"
-    assert async_refresh.called
+    async_refresh.assert_called_once_with("DUMMY_USER_My_House")
     resp.close()
 
 
@@ -236,3 +254,71 @@ async def test_webhook_unknown_message(
     assert len(webhook_setup.events) == 0
     assert not async_refresh.called
     resp.close()
+
+
+async def test_webhook_adaptive_alerts_interval(
+    webhook_setup: WebhookSetupData,
+    webhook_config_entry: HomelinkMockConfigEntry,
+) -> None:
+    """Test alert polling backs off while the webhook is healthy."""
+    alerts_coordinator = webhook_config_entry.runtime_data.coordinator.tiers[
+        COORD_ALERTS
+    ]
+    assert alerts_coordinator.update_interval == RETRIEVAL_INTERVAL_ALERTS
+
+    resp = await webhook_setup.client.post(
+        urlparse(webhook_setup.webhook_url).path,
+        json=load_webhook_json("unknown_type.json"),
+    )
+    await webhook_setup.hass.async_block_till_done()
+    resp.close()
+    await alerts_coordinator.async_refresh()
+    assert alerts_coordinator.update_interval == RETRIEVAL_INTERVAL_ALERTS_PUSH
+
+    webhook_config_entry.runtime_data.webhook.unregister_webhooks(
+        webhook_setup.hass, webhook_config_entry.options[CONF_WEBHOOK_ID]
+    )
+    await webhook_setup.hass.async_block_till_done()
+    assert alerts_coordinator.update_interval == RETRIEVAL_INTERVAL_ALERTS
+
+
+async def test_webhook_pushed_alert_restores_alerts_interval(
+    webhook_setup: WebhookSetupData,
+    webhook_config_entry: HomelinkMockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test a pushed alert brings back polling at the normal rate."""
+    coordinator = webhook_config_entry.runtime_data.coordinator
+    alerts_coordinator = coordinator.tiers[COORD_ALERTS]
+
+    resp = await webhook_setup.client.post(
+        urlparse(webhook_setup.webhook_url).path,
+        json=load_webhook_json("unknown_type.json"),
+    )
+    await webhook_setup.hass.async_block_till_done()
+    resp.close()
+    await alerts_coordinator.async_refresh()
+    assert alerts_coordinator.update_interval == RETRIEVAL_INTERVAL_ALERTS_PUSH
+
+    alerts = json.loads(load_json("base/alerts_alarm.json"))
+    alerts["results"][0]["raisedDate"] = dt_util.utcnow().isoformat()
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        f"{BASE_API_URL}/property/DUMMY_USER_My_House/alerts", json=alerts
+    )
+    assert await coordinator.async_refresh_property_alerts("DUMMY_USER_My_House")
+    await webhook_setup.hass.async_block_till_done()
+
+    assert alerts_coordinator.update_interval == RETRIEVAL_INTERVAL_ALERTS
+
+    # A long running alert leaves the slower rate in place
+    aioclient_mock.clear_requests()
+    create_mock(
+        aioclient_mock,
+        "/property/DUMMY_USER_My_House/alerts",
+        "base/alerts_alarm.json",
+    )
+    assert await coordinator.async_refresh_property_alerts("DUMMY_USER_My_House")
+    await webhook_setup.hass.async_block_till_done()
+
+    assert alerts_coordinator.update_interval == RETRIEVAL_INTERVAL_ALERTS_PUSH
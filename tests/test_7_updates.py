@@ -1,12 +1,27 @@
 """Test sensors."""
 
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from custom_components.homelink.const import COORD_ALERTS, HOMELINK_ADD_TOPOLOGY
 
 from .conftest import HomelinkMockConfigEntry, standard_mocks
-from .helpers.utils import add_device_mocks, add_property_mocks
+from .helpers.const import BASE_API_URL
+from .helpers.utils import (
+    add_device_mocks,
+    add_property_mocks,
+    create_mock,
+    load_json,
+)
 
 
 async def test_add_property(
@@ -29,11 +44,18 @@ async def test_add_property(
     )
     assert len(entities) == 44
 
+    signals = []
+    async_dispatcher_connect(
+        hass, HOMELINK_ADD_TOPOLOGY, lambda *args: signals.append(args)
+    )
     aioclient_mock.clear_requests()
     add_property_mocks(aioclient_mock)
 
     await coordinator.async_refresh()
     await hass.async_block_till_done()
+    assert len(signals) == 1
+    assert signals[0][0] == ["DUMMY_USER_My_New_House"]
+    assert signals[0][1] == []
     devices = device_registry.devices.get_devices_for_config_entry_id(
         insight_config_entry.entry_id
     )
@@ -65,11 +87,18 @@ async def test_add_device(
     )
     assert len(entities) == 30
 
+    signals = []
+    async_dispatcher_connect(
+        hass, HOMELINK_ADD_TOPOLOGY, lambda *args: signals.append(args)
+    )
     aioclient_mock.clear_requests()
     add_device_mocks(aioclient_mock)
 
     await coordinator.async_refresh()
     await hass.async_block_till_done()
+    assert len(signals) == 1
+    assert signals[0][0] == []
+    assert [added.device_key for added in signals[0][1]] == ["D6OLDOLD"]
     devices = device_registry.devices.get_devices_for_config_entry_id(
         base_config_entry.entry_id
     )
@@ -159,3 +188,149 @@ async def test_delete_property(
         entity_registry, insight_config_entry.entry_id
     )
     assert len(entities) == 44
+
+
+async def test_alerts_tier_refresh(
+    hass: HomeAssistant,
+    setup_insight_integration: None,
+    insight_config_entry: HomelinkMockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test the alerts coordinator only retrieves alerts."""
+    coordinator = insight_config_entry.runtime_data.coordinator
+
+    aioclient_mock.clear_requests()
+    standard_mocks(aioclient_mock)
+
+    await coordinator.tiers[COORD_ALERTS].async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.tiers[COORD_ALERTS].last_update_success
+    assert aioclient_mock.call_count == 1
+    assert str(aioclient_mock.mock_calls[0][1]).endswith(
+        "/property/DUMMY_USER_My_House/alerts"
+    )
+
+
+async def test_property_alerts_refresh(
+    hass: HomeAssistant,
+    setup_insight_integration: None,
+    insight_config_entry: HomelinkMockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test a targeted refresh only retrieves the alerts of one property."""
+    coordinator = insight_config_entry.runtime_data.coordinator
+
+    aioclient_mock.clear_requests()
+    standard_mocks(aioclient_mock)
+
+    await coordinator.async_refresh_property_alerts("DUMMY_USER_My_House")
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert str(aioclient_mock.mock_calls[0][1]).endswith(
+        "/property/DUMMY_USER_My_House/alerts"
+    )
+
+
+@pytest.mark.usefixtures("setup_base_integration")
+async def test_property_devices_refresh(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test a targeted refresh adds devices of one property."""
+    coordinator = base_config_entry.runtime_data.coordinator
+
+    aioclient_mock.clear_requests()
+    create_mock(
+        aioclient_mock, "/property/DUMMY_USER_My_House/devices", "base/devicex3.json"
+    )
+
+    await coordinator.async_refresh_property_devices("DUMMY_USER_My_House")
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    devices = device_registry.devices.get_devices_for_config_entry_id(
+        base_config_entry.entry_id
+    )
+    assert len(devices) == 12
+
+    entities = er.async_entries_for_config_entry(
+        entity_registry, base_config_entry.entry_id
+    )
+    assert len(entities) == 33
+
+
+async def test_refresh_requests_coalesced(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test a burst of refresh requests is collapsed into one fetch of each."""
+    coordinator = base_config_entry.runtime_data.coordinator
+
+    aioclient_mock.clear_requests()
+    standard_mocks(aioclient_mock)
+    create_mock(
+        aioclient_mock, "/property/DUMMY_USER_My_House/devices", "base/device.json"
+    )
+
+    results = await asyncio.gather(
+        coordinator.async_refresh_property_alerts("DUMMY_USER_My_House"),
+        coordinator.async_refresh_property_devices("DUMMY_USER_My_House"),
+        coordinator.async_refresh_property_alerts("DUMMY_USER_My_House"),
+        coordinator.async_refresh_property_alerts("DUMMY_USER_My_House"),
+    )
+    await hass.async_block_till_done()
+
+    assert all(results)
+    assert aioclient_mock.call_count == 2
+
+
+async def test_device_change_notifies_device_entities(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test a change to one device only updates that device's entities."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    await coordinator.async_refresh()
+
+    devices = json.loads(load_json("base/device.json"))
+    devices["results"][0]["metadata"]["signalStrength"] = -60
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(f"{BASE_API_URL}/device", json=devices)
+    standard_mocks(aioclient_mock)
+    with patch.object(Entity, "async_write_ha_state", autospec=True) as write_state:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    # The date sensors for the device are disabled by default
+    assert [call.args[0].entity_id for call in write_state.call_args_list] == [
+        "binary_sensor.dummy_user_my_house_livingroom_firealarm",
+    ]
+
+
+async def test_unchanged_state_not_written(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test an update that changes nothing about an entity does not write it."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    alerts_coordinator = coordinator.tiers[COORD_ALERTS]
+    alerts_coordinator.async_update_listeners()
+    listeners = len(alerts_coordinator._listeners)  # noqa: SLF001
+    skipped_writes = coordinator.skipped_writes
+
+    with patch.object(Entity, "async_write_ha_state", autospec=True) as write_state:
+        alerts_coordinator.async_update_listeners()
+        await hass.async_block_till_done()
+
+    assert write_state.call_count == 0
+    assert coordinator.skipped_writes == skipped_writes + listeners
@@ -1,6 +1,7 @@
 """Test readings."""
 
-from datetime import timedelta
+from datetime import date, timedelta
+import json
 from unittest.mock import patch
 
 import pytest
@@ -8,8 +9,17 @@ from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClien
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
 
-from .conftest import HomelinkMockConfigEntry
+from custom_components.homelink.const import (
+    COORD_READINGS,
+    RETRIEVAL_MAX_DAYS_PER_UPDATE,
+)
+from custom_components.homelink.helpers.readings import HomeLINKReadingsTracker
+from custom_components.homelink.helpers.views import HomeLINKReadingsView
+from pyhomelink.reading import PropertyReading
+
+from .conftest import HomelinkMockConfigEntry, standard_mocks
 from .data.state.device_state import (
     CARBONDIOXIDE,
     ELECTRICITY,
@@ -19,7 +29,8 @@ from .data.state.device_state import (
     HUMIDITY,
     TEMPERATURE,
 )
-from .helpers.utils import check_entity_state, ignore_reading_mocks
+from .helpers.const import BASE_API_URL
+from .helpers.utils import check_entity_state, ignore_reading_mocks, load_json
 
 
 @pytest.mark.parametrize(
@@ -84,7 +95,7 @@ async def test_readings_update_throttled(
     device_registry: dr.DeviceRegistry,
     aioclient_mock: AiohttpClientMocker,
 ):
-    """Test readings update is throttled."""
+    """Test readings are not retrieved by the topology refresh."""
     coordinator = base_config_entry.runtime_data.coordinator
 
     with patch(
@@ -96,10 +107,6 @@ async def test_readings_update_throttled(
     assert not async_retrieve_readings.called
 
 
-@patch(
-    "custom_components.homelink.helpers.coordinator.RETRIEVAL_INTERVAL_READINGS",
-    timedelta(minutes=0),
-)
 async def test_readings_update(
     hass: HomeAssistant,
     setup_base_integration: None,
@@ -107,8 +114,8 @@ async def test_readings_update(
     device_registry: dr.DeviceRegistry,
     aioclient_mock: AiohttpClientMocker,
 ):
-    """Test readings update with throttle removed."""
-    coordinator = base_config_entry.runtime_data.coordinator
+    """Test readings update from the readings coordinator."""
+    coordinator = base_config_entry.runtime_data.coordinator.tiers[COORD_READINGS]
 
     # This also runs a test through to ensure the invalid reading device code is tested.
     # Not clear how to asset this is true
@@ -124,10 +131,6 @@ async def test_readings_update(
     assert async_retrieve_readings.called
 
 
-@patch(
-    "custom_components.homelink.helpers.coordinator.RETRIEVAL_INTERVAL_READINGS",
-    timedelta(minutes=0),
-)
 async def test_readings_ignored(
     hass: HomeAssistant,
     setup_base_integration: None,
@@ -135,8 +138,8 @@ async def test_readings_ignored(
     device_registry: dr.DeviceRegistry,
     aioclient_mock: AiohttpClientMocker,
 ):
-    """Test readings update with throttle removed."""
-    coordinator = base_config_entry.runtime_data.coordinator
+    """Test readings for unknown devices are ignored."""
+    coordinator = base_config_entry.runtime_data.coordinator.tiers[COORD_READINGS]
 
     aioclient_mock.clear_requests()
     ignore_reading_mocks(aioclient_mock)
@@ -147,3 +150,199 @@ async def test_readings_ignored(
         await coordinator.async_refresh()
     await hass.async_block_till_done()
     assert not update_values.called
+
+
+def _reading(*reading_dates: str) -> PropertyReading:
+    return PropertyReading(
+        {
+            "unit": "n/a",
+            "type": "electricity-power-hour",
+            "devices": [
+                {
+                    "count": len(reading_dates),
+                    "serialNumber": "299991234567",
+                    "_rel": {},
+                    "values": [
+                        {"value": index, "readingDate": reading_date}
+                        for index, reading_date in enumerate(reading_dates)
+                    ],
+                }
+            ],
+        }
+    )
+
+
+async def test_readings_midnight_rollover():
+    """Test readings published late on the previous day are picked up."""
+    tracker = HomeLINKReadingsTracker()
+    yesterday, today = date(2024, 10, 28), date(2024, 10, 29)
+
+    assert tracker.days_to_fetch("PROPERTY", yesterday) == [yesterday]
+    tracker.update(
+        "PROPERTY", [_reading("2024-10-28T22:00:00.000Z")], [yesterday], yesterday
+    )
+    assert tracker.days_to_fetch("PROPERTY", yesterday) == [yesterday]
+
+    # First retrieval after midnight also retrieves the previous day
+    assert tracker.days_to_fetch("PROPERTY", today) == [yesterday, today]
+    readings = tracker.update(
+        "PROPERTY",
+        [
+            _reading("2024-10-28T23:00:00.000Z", "2024-10-28T22:00:00.000Z"),
+            _reading(),
+        ],
+        [yesterday, today],
+        today,
+    )
+    assert [value.value for value in readings[0].devices[0].values] == [0]
+    assert tracker.days_to_fetch("PROPERTY", today) == [today]
+
+    readings = tracker.update(
+        "PROPERTY", [_reading("2024-10-29T00:00:00.000Z")], [today], today
+    )
+    assert readings[0].devices[0].values[0].readingdate.hour == 0
+
+
+async def test_readings_gap():
+    """Test days missed since the last readings are retrieved."""
+    tracker = HomeLINKReadingsTracker()
+    today = date(2024, 10, 29)
+
+    tracker.restore("PROPERTY", [_reading("2024-10-26T22:00:00.000Z")])
+    assert tracker.days_to_fetch("PROPERTY", today) == [
+        date(2024, 10, 26),
+        date(2024, 10, 27),
+        date(2024, 10, 28),
+        today,
+    ]
+    # Restored readings are the watermark for those retrieved
+    readings = tracker.update(
+        "PROPERTY",
+        [_reading("2024-10-26T21:00:00.000Z"), _reading("2024-10-28T01:00:00.000Z")],
+        [date(2024, 10, 26), date(2024, 10, 27), date(2024, 10, 28), today],
+        today,
+    )
+    assert readings[0].devices[0].values[0].readingdate.day == 28
+
+    # No further back than the API holds readings, a few days per update and
+    # always today
+    tracker.restore("PROPERTY", [_reading("2024-08-01T22:00:00.000Z")])
+    days = tracker.days_to_fetch("PROPERTY", today)
+    assert days[0] == date(2024, 9, 29)
+    assert len(days) == RETRIEVAL_MAX_DAYS_PER_UPDATE
+    assert days[-1] == today
+
+    # The next update carries on from the day after the last missed day
+    tracker.update("PROPERTY", [], days, today)
+    assert tracker.days_to_fetch("PROPERTY", today)[0] == days[-2] + timedelta(days=1)
+
+
+async def test_readings_gap_retrieved(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test the missed days are retrieved on the readings update."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    today = date.today()
+    coordinator._readings.restore(  # noqa: SLF001 # pylint: disable=protected-access
+        "DUMMY_USER_My_House",
+        [_reading(f"{today - timedelta(days=3)}T22:00:00.000Z")],
+    )
+
+    with patch(
+        "pyhomelink.property.Property.async_get_readings", return_value=[]
+    ) as get_readings:
+        await coordinator.tiers[COORD_READINGS].async_refresh()
+    await hass.async_block_till_done()
+
+    assert [call.args[0] for call in get_readings.call_args_list] == [
+        today - timedelta(days=offset) for offset in range(3, -1, -1)
+    ]
+
+
+@pytest.mark.usefixtures("setup_base_integration")
+async def test_readings_long_gap_spread(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+):
+    """Test a long gap is retrieved a few days per update, oldest first."""
+    coordinator = base_config_entry.runtime_data.coordinator
+    today = date.today()
+    first_day = today - timedelta(days=20)
+    coordinator._readings.restore(  # noqa: SLF001 # pylint: disable=protected-access
+        "DUMMY_USER_My_House", [_reading(f"{first_day}T22:00:00.000Z")]
+    )
+
+    missed_per_update = RETRIEVAL_MAX_DAYS_PER_UPDATE - 1
+    for update in range(2):
+        with (
+            patch(
+                "pyhomelink.property.Property.async_get_readings",
+                side_effect=lambda day: [_reading(f"{day}T01:00:00.000Z")],
+            ) as get_readings,
+            patch.object(
+                coordinator._statistics,  # noqa: SLF001 # pylint: disable=protected-access
+                "async_schedule_import",
+            ) as schedule_import,
+        ):
+            await coordinator.tiers[COORD_READINGS].async_refresh()
+        await hass.async_block_till_done()
+
+        assert coordinator.tiers[COORD_READINGS].last_update_success
+        missed_days = [
+            first_day + timedelta(days=update * missed_per_update + offset)
+            for offset in range(missed_per_update)
+        ]
+        assert [call.args[0] for call in get_readings.call_args_list] == [
+            *missed_days,
+            today,
+        ]
+        # Today is held back from the statistics until the gap is filled
+        imported = schedule_import.call_args.args[1]
+        assert [
+            reading.devices[0].values[0].readingdate.date() for reading in imported
+        ] == missed_days
+
+
+async def test_readings_view():
+    """Test the readings view holds the newest value by type and device."""
+    reading = _reading("2024-10-29T01:00:00.000Z", "2024-10-29T03:00:00.000Z")
+    reading.devices[0]._raw_data["serialNumber"] = "GATEWAY-299991234567"  # noqa: SLF001
+    empty = _reading()
+    empty._raw_data["type"] = "gas-power-hour"  # noqa: SLF001
+
+    readings_view = HomeLINKReadingsView([reading, empty], "GATEWAY")
+    latest = readings_view.latest[("electricity-power-hour", "299991234567")]
+    assert latest.value == 1
+    assert latest.readingdate.hour == 3
+    assert readings_view.latest[("gas-power-hour", "299991234567")] is None
+
+
+async def test_reading_written_once(
+    hass: HomeAssistant,
+    setup_base_integration: None,
+    base_config_entry: HomelinkMockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test a new reading value writes its sensor state exactly once."""
+    coordinator = base_config_entry.runtime_data.coordinator.tiers[COORD_READINGS]
+    await coordinator.async_refresh()
+
+    readings = json.loads(load_json("base/readings.json"))
+    readings[1]["devices"][0]["values"].append(
+        {"value": 1300, "readingDate": "2024-09-07T09:52:03.000Z"}
+    )
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        f"{BASE_API_URL}/property/DUMMY_USER_My_House/readings?date={date.today()}",
+        json=readings,
+    )
+    standard_mocks(aioclient_mock)
+    with patch.object(Entity, "async_write_ha_state", autospec=True) as write_state:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert [call.args[0].entity_id for call in write_state.call_args_list] == [
+        "sensor.dummy_user_my_house_hallway1_envco2sensor_carbon_dioxide",
+    ]
@@ -1,15 +1,39 @@
 """Test odds and sods."""
+
+import asyncio
 from asyncio import TimeoutError
-from unittest.mock import patch
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
+from aiohttp import ClientConnectionError
 from pyhomelink.exceptions import ApiException, AuthException
 import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
-from custom_components.homelink.const import DOMAIN
+from custom_components.homelink.const import (
+    COORD_ALERTS,
+    COORD_PROPERTIES,
+    COORD_STALE,
+    DOMAIN,
+)
 from custom_components.homelink.diagnostics import async_get_config_entry_diagnostics
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.homelink.helpers.api import (
+    AsyncConfigEntryAuth,
+    HomeLINKResponseCache,
+)
+from custom_components.homelink.helpers.coordinator import HomeLINKDataCoordinator
+from custom_components.homelink.helpers.retry import (
+    CircuitOpenException,
+    HomeLINKApiGuard,
+)
+from pyhomelink import HomeLINKApi
 
 from .conftest import HomelinkMockConfigEntry
+from .helpers.const import BASE_API_URL
+from .helpers.benchmark import PROPERTY_REFERENCE, LatencyAuth, build_portfolio
 
 
 async def test_diagnostics(
@@ -18,6 +42,8 @@ async def test_diagnostics(
     base_config_entry: HomelinkMockConfigEntry,
 ):
     """Test Diagnostics."""
+    # Unchanged properties and devices are served from the response cache
+    await base_config_entry.runtime_data.coordinator.async_refresh()
     result = await async_get_config_entry_diagnostics(hass, base_config_entry)
 
     assert "config_entry_data" in result
@@ -26,6 +52,95 @@ async def test_diagnostics(
     assert "token" in result["config_entry_data"]
     assert result["config_entry_data"]["token"]["access_token"] == "**REDACTED**"
     assert result["config_entry_data"]["token"]["refresh_token"] is None
+    assert result["coordinator"] == {
+        "api": {
+            "state": "closed",
+            "consecutive_failures": 0,
+            "retries": 0,
+            "rejected": 0,
+        },
+        "cache": {"entries": 4, "hits": 2, "misses": 4},
+        "property_failures": {},
+        "skipped_writes": 0,
+        "stale": {},
+    }
+
+
+def _response(status: int, body: bytes = b"", etag: str | None = None) -> Mock:
+    return Mock(
+        status=status,
+        url="property",
+        headers={"ETag": etag} if etag else {},
+        read=AsyncMock(return_value=body),
+    )
+
+
+async def test_response_cache():
+    """Test unchanged responses are served from the cache."""
+    cache = HomeLINKResponseCache()
+
+    resp = await cache.async_process("property", _response(200, b'{"results": [1]}'))
+    assert await resp.json() == {"results": [1]}
+    assert not cache.conditional_headers("property")
+    # An identical body is not decoded again
+    resp = await cache.async_process("property", _response(200, b'{"results": [1]}'))
+    payload = await resp.json()
+    resp = await cache.async_process("property", _response(200, b'{"results": [1]}'))
+    assert await resp.json() is payload
+    resp = await cache.async_process("property", _response(200, b'{"results": [2]}'))
+    assert await resp.json() == {"results": [2]}
+    assert cache.as_dict() == {"entries": 1, "hits": 2, "misses": 2}
+
+    # A validator is sent back, and not modified is served from the cache
+    await cache.async_process("alerts", _response(200, b'{"results": []}', '"v1"'))
+    assert cache.conditional_headers("alerts") == {"If-None-Match": '"v1"'}
+    resp = await cache.async_process("alerts", _response(304))
+    assert resp.status == 200
+    assert await resp.json() == {"results": []}
+    # Errors are passed through
+    error = _response(500)
+    assert await cache.async_process("alerts", error) is error
+    assert cache.as_dict() == {"entries": 2, "hits": 3, "misses": 3}
+
+
+async def test_conditional_request(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test API requests carry the validators of the cached response."""
+    aioclient_mock.get(
+        f"{BASE_API_URL}/property",
+        text='{"results": []}',
+        headers={"ETag": '"v1"'},
+    )
+    auth = AsyncConfigEntryAuth(
+        async_get_clientsession(hass),
+        Mock(valid_token=True, token={"access_token": "token"}),
+    )
+
+    for _ in range(2):
+        resp = await auth.request("get", "property")
+        assert await resp.json() == {"results": []}
+
+    headers = aioclient_mock.mock_calls[1][3]
+    assert headers["Authorization"] == "Bearer token"
+    assert headers["If-None-Match"] == '"v1"'
+    assert auth.cache.as_dict() == {"entries": 1, "hits": 1, "misses": 1}
+
+    # Readings are not cached
+    aioclient_mock.get(
+        f"{BASE_API_URL}/property/DUMMY_USER_My_House/readings?date=2024-10-29",
+        text="[]",
+        headers={"ETag": '"v1"'},
+    )
+    for _ in range(2):
+        resp = await auth.request(
+            "get", "property/DUMMY_USER_My_House/readings?date=2024-10-29"
+        )
+        assert await resp.json() == []
+
+    assert "If-None-Match" not in aioclient_mock.mock_calls[3][3]
+    assert auth.cache.as_dict() == {"entries": 1, "hits": 1, "misses": 1}
 
 
 async def test_coordinator_auth_error(
@@ -85,3 +200,131 @@ async def test_coordinator_timeout_error(
         await coordinator.async_refresh()
 
     assert "Timeout communicating with HL API" in caplog.text
+
+
+async def test_coordinator_property_error(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test a failing property keeps its last data while others update."""
+    base_config_entry.add_to_hass(hass)
+    auth = LatencyAuth(build_portfolio(2, 3, alerts_per_property=1))
+    coordinator = HomeLINKDataCoordinator(
+        hass,
+        HomeLINKApi(auth),
+        base_config_entry,
+        api_guard=HomeLINKApiGuard(attempts=1),
+    )
+    await coordinator.async_refresh()
+    good, failing = (
+        PROPERTY_REFERENCE.format(property_index=property_index)
+        for property_index in range(2)
+    )
+
+    auth.responses[f"property/{good}/alerts"] = {"results": []}
+    auth.responses.pop(f"property/{failing}/alerts")
+    await coordinator.tiers[COORD_ALERTS].async_refresh()
+
+    assert coordinator.tiers[COORD_ALERTS].last_update_success
+    coord_properties = coordinator.data[COORD_PROPERTIES]
+    assert coord_properties[good][COORD_ALERTS] == []
+    assert not coord_properties[good][COORD_STALE]
+    assert len(coord_properties[failing][COORD_ALERTS]) == 1
+    assert coord_properties[failing][COORD_STALE] == {COORD_ALERTS}
+    assert coordinator.property_failures == {failing: 1}
+    assert f"Error retrieving data for property {failing}" in caplog.text
+
+    auth.responses[f"property/{failing}/alerts"] = {"results": []}
+    await coordinator.tiers[COORD_ALERTS].async_refresh()
+
+    assert not coord_properties[failing][COORD_STALE]
+
+
+async def test_coordinator_breaker_open(
+    hass: HomeAssistant,
+    base_config_entry: HomelinkMockConfigEntry,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test an open breaker fails the cycle once rather than every property."""
+    base_config_entry.add_to_hass(hass)
+    auth = LatencyAuth(build_portfolio(3, 3, alerts_per_property=1))
+    guard = HomeLINKApiGuard(
+        attempts=1, breaker_threshold=1, breaker_reset=timedelta(minutes=5)
+    )
+    coordinator = HomeLINKDataCoordinator(
+        hass, HomeLINKApi(auth), base_config_entry, api_guard=guard
+    )
+    await coordinator.async_refresh()
+
+    with pytest.raises(ApiException):
+        await guard.async_call(AsyncMock(side_effect=ApiException()))
+    await coordinator.tiers[COORD_ALERTS].async_refresh()
+
+    assert not coordinator.tiers[COORD_ALERTS].last_update_success
+    assert coordinator.property_failures == {}
+    assert "Error retrieving data for property" not in caplog.text
+    assert caplog.text.count("circuit breaker is open") == 1
+
+
+async def test_api_guard_breaker():
+    """Test API calls are retried and the breaker opens, then closes."""
+    guard = HomeLINKApiGuard(
+        attempts=3,
+        backoff_base=timedelta(0),
+        breaker_threshold=2,
+        breaker_reset=timedelta(0),
+    )
+    failing = AsyncMock(side_effect=ApiException())
+
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            await guard.async_call(failing)
+    assert failing.call_count == 6
+    assert guard.as_dict() == {
+        "state": "open",
+        "consecutive_failures": 2,
+        "retries": 4,
+        "rejected": 0,
+    }
+
+    # Reset period passed so a single trial call is let through
+    assert await guard.async_call(AsyncMock(return_value="ok")) == "ok"
+    assert guard.state == "closed"
+
+    guard = HomeLINKApiGuard(
+        attempts=1, breaker_threshold=1, breaker_reset=timedelta(minutes=5)
+    )
+    with pytest.raises(ApiException):
+        await guard.async_call(failing)
+    with pytest.raises(CircuitOpenException):
+        await guard.async_call(failing)
+    assert failing.call_count == 7
+    assert guard.rejected == 1
+
+
+async def test_api_guard_timeouts_and_connection_errors():
+    """Test hung calls and connection errors are retried and open the breaker."""
+
+    async def _hung() -> None:
+        await asyncio.sleep(1)
+
+    guard = HomeLINKApiGuard(
+        attempt_timeout=timedelta(milliseconds=10), backoff_base=timedelta(0)
+    )
+    hung = AsyncMock(side_effect=_hung)
+    for _ in range(5):
+        with pytest.raises(TimeoutError):
+            await guard.async_call(hung)
+    assert hung.call_count == 10
+    assert guard.state == "open"
+    assert guard.consecutive_failures == 5
+
+    guard = HomeLINKApiGuard(backoff_base=timedelta(0))
+    failing = AsyncMock(side_effect=ClientConnectionError())
+    for _ in range(5):
+        with pytest.raises(ApiException):
+            await guard.async_call(failing)
+    assert failing.call_count == 10
+    assert guard.state == "open"
+    assert guard.consecutive_failures == 5